@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING, Any, cast
 
 from openai import APIConnectionError, APIStatusError, APITimeoutError, AsyncOpenAI
@@ -12,9 +11,9 @@ from extractforms import logger
 from extractforms.async_runner import run_async
 from extractforms.exceptions import BackendError
 from extractforms.prompts import (
+    build_keys_extraction_prompt,
     build_schema_inference_prompt,
-    build_values_extraction_prompt,
-    schema_response_format,
+    model_response_format_payload,
 )
 from extractforms.typing.models import FieldValue, PricingCall, RenderedPage, SchemaField, SchemaSpec
 
@@ -45,6 +44,8 @@ class MultimodalLLMBackend:
             settings (Settings): Runtime settings.
         """
         self._settings = settings
+        # Pages are sent once per key chunk; each image is base64-encoded once per backend.
+        self._image_urls: dict[RenderedPage, str] = {}
 
     async def _apost_chat_completions(
         self,
@@ -115,9 +116,8 @@ class MultimodalLLMBackend:
         """
         return run_async(self._apost_chat_completions(payload))
 
-    @staticmethod
-    def _image_content(page: RenderedPage) -> dict[str, Any]:
-        """Build image content chunk.
+    def _image_content(self, page: RenderedPage) -> dict[str, Any]:
+        """Build image content chunk, reusing the page's data URL across requests.
 
         Args:
             page (RenderedPage): Rendered page.
@@ -125,29 +125,30 @@ class MultimodalLLMBackend:
         Returns:
             dict[str, Any]: OpenAI content block.
         """
-        return {
-            "type": "image_url",
-            "image_url": {"url": f"data:{page.mime_type};base64,{page.data_base64}"},
-        }
+        url = self._image_urls.get(page)
+        if url is None:
+            url = f"data:{page.mime_type};base64,{page.data_base64}"
+            self._image_urls[page] = url
+        return {"type": "image_url", "image_url": {"url": url}}
 
-    async def ainfer_schema(self, pages: list[RenderedPage]) -> tuple[SchemaSpec, PricingCall | None]:
-        """Infer schema from rendered pages.
+    def _build_pages_payload(
+        self,
+        prompt: str,
+        pages: list[RenderedPage],
+        response_name: str,
+        response_model: type[BaseModel],
+    ) -> dict[str, Any]:
+        """Build one chat completion payload carrying a prompt and page images.
 
         Args:
+            prompt (str): Instruction prompt.
             pages (list[RenderedPage]): Rendered pages.
-
-        Raises:
-            BackendError: If page list is empty.
+            response_name (str): Strict response schema name.
+            response_model (type[BaseModel]): Response model describing the expected JSON.
 
         Returns:
-            tuple[SchemaSpec, PricingCall | None]: Inferred schema and call pricing.
+            dict[str, Any]: Chat completion payload.
         """
-        if not pages:
-            raise BackendError(message="Cannot infer schema from empty page list")
-
-        prompt = build_schema_inference_prompt()
-        response_format = schema_response_format("schema_response", _SchemaResponse.model_json_schema())
-
         content: list[dict[str, Any]] = [{"type": "text", "text": prompt}]
         for page in pages:
             content.extend(
@@ -160,24 +161,40 @@ class MultimodalLLMBackend:
                 ),
             )
 
-        payload = {
+        return {
             "model": self._settings.openai_model,
             "messages": [{"role": "user", "content": content}],
-            "response_format": {
-                "type": "json_schema",
-                "json_schema": response_format.model_dump(mode="json", by_alias=True),
-            },
+            "response_format": model_response_format_payload(response_name, response_model),
         }
 
+    async def ainfer_schema(self, pages: list[RenderedPage]) -> tuple[SchemaSpec, PricingCall | None]:
+        """Infer schema from rendered pages.
+
+        Args:
+            pages (list[RenderedPage]): Rendered pages.
+
+        Raises:
+            BackendError: If page list is empty.
+
+        Returns:
+            tuple[SchemaSpec, PricingCall | None]: Inferred schema and call pricing.
+        """
+        if not pages:
+            raise BackendError(message="Cannot infer schema from empty page list")
+
+        prompt = build_schema_inference_prompt()
+
+        payload = self._build_pages_payload(prompt, pages, "schema_response", _SchemaResponse)
+
         data, pricing = await self._apost_chat_completions(payload)
         content_text = data["choices"][0]["message"]["content"]
-        parsed = _SchemaResponse.model_validate(json.loads(content_text))
+        parsed = _SchemaResponse.model_validate_json(content_text)
 
         schema = SchemaSpec(
             id="",
             name=parsed.name,
             fingerprint="",
-            fields=parsed.fields,
+            fields=tuple(parsed.fields),
         )
         logger.info("Schema inferred", extra={"fields": len(schema.fields)})
         return schema, pricing
@@ -216,39 +233,13 @@ class MultimodalLLMBackend:
         if not pages:
             raise BackendError(message="Cannot extract values from empty page list")
 
-        schema = SchemaSpec(
-            id="",
-            name="runtime",
-            fingerprint="",
-            fields=[SchemaField(key=k, label=k) for k in keys],
-        )
-        prompt = build_values_extraction_prompt(schema, extra_instructions=extra_instructions)
-        response_format = schema_response_format("values_response", _ValuesResponse.model_json_schema())
-
-        content: list[dict[str, Any]] = [{"type": "text", "text": prompt}]
-        for page in pages:
-            content.extend(
-                (
-                    {
-                        "type": "text",
-                        "text": f"--- PAGE {page.page_number} (PDF order, 1-based) ---",
-                    },
-                    self._image_content(page),
-                ),
-            )
+        prompt = build_keys_extraction_prompt(keys, extra_instructions=extra_instructions)
 
-        payload = {
-            "model": self._settings.openai_model,
-            "messages": [{"role": "user", "content": content}],
-            "response_format": {
-                "type": "json_schema",
-                "json_schema": response_format.model_dump(mode="json", by_alias=True),
-            },
-        }
+        payload = self._build_pages_payload(prompt, pages, "values_response", _ValuesResponse)
 
         data, pricing = await self._apost_chat_completions(payload)
         content_text = data["choices"][0]["message"]["content"]
-        parsed = _ValuesResponse.model_validate(json.loads(content_text))
+        parsed = _ValuesResponse.model_validate_json(content_text)
         logger.info("Values extracted", extra={"fields": len(parsed.fields)})
         return parsed.fields, pricing
 
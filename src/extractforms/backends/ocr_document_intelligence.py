@@ -112,7 +112,7 @@ class OCRBackend:
             id="ocr-schema",
             name="OCR Inferred Schema",
             fingerprint="ocr",
-            fields=fields,
+            fields=tuple(fields),
         ), None
 
     def extract_values(
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import asyncio
 import importlib
-import json
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
@@ -418,6 +417,8 @@ def _build_result(
         else:
             normalized_value = field_value.model_copy(
                 update={
+                    # Reuse the interned schema key rather than the backend's equal copy.
+                    "key": schema_field.key,
                     "value": normalize_typed_value(
                         value=field_value.value,
                         schema_field=schema_field,
@@ -427,7 +428,7 @@ def _build_result(
             )
 
         normalized.append(normalized_value)
-        flat[normalized_value.key] = normalized_value.value
+        flat[schema_field.key] = normalized_value.value
 
     return ExtractionResult(
         fields=normalized,
@@ -570,7 +571,7 @@ def infer_schema(request: ExtractRequest, settings: Settings) -> tuple[SchemaSpe
     Returns:
         tuple[SchemaSpec, PricingCall | None]: Inferred schema and pricing.
     """
-    fingerprint = SchemaStore.fingerprint_pdf(request.input_path)
+    fingerprint = SchemaStore.fingerprint_pdf(request.input_path, settings.fingerprint_algorithm)
     pages = render_pdf_pages(
         request.input_path,
         dpi=request.dpi,
@@ -835,18 +836,18 @@ def _filter_blank_pages_if_requested(
     )
 
 
-def match_schema(pdf: Path, schemas_store: SchemaStore, _settings: Settings) -> MatchResult:
+def match_schema(pdf: Path, schemas_store: SchemaStore, settings: Settings) -> MatchResult:
     """Match document against schema cache.
 
     Args:
         pdf (Path): PDF to match.
         schemas_store (SchemaStore): Schema storage.
-        _settings (Settings): Runtime settings (currently unused; reserved for future matching configuration).
+        settings (Settings): Runtime settings.
 
     Returns:
         MatchResult: Match payload.
     """
-    fingerprint = SchemaStore.fingerprint_pdf(pdf)
+    fingerprint = SchemaStore.fingerprint_pdf(pdf, settings.fingerprint_algorithm)
     return schemas_store.match_schema(fingerprint)
 
 
@@ -914,13 +915,11 @@ def _run_two_pass(
         tuple[ExtractionResult, bool]: Extraction result and cache-hit flag.
     """
     if request.match_schema or request.use_cache:
-        fingerprint = SchemaStore.fingerprint_pdf(request.input_path)
-        matched = store.match_schema(fingerprint)
-        if matched.matched and matched.schema_id:
-            cached_schema = _load_schema_by_id(store, matched.schema_id)
-            if cached_schema is not None:
-                cached_result, _ = extract_values(cached_schema, request, settings)
-                return cached_result, True
+        fingerprint = SchemaStore.fingerprint_pdf(request.input_path, settings.fingerprint_algorithm)
+        cached_schema = store.load_by_fingerprint(fingerprint)
+        if cached_schema is not None:
+            cached_result, _ = extract_values(cached_schema, request, settings)
+            return cached_result, True
 
     schema, _ = infer_schema(request, settings)
     if request.use_cache:
@@ -984,4 +983,4 @@ def result_to_json_dict(result: ExtractionResult) -> dict[str, object]:
     Returns:
         dict[str, object]: JSON-serializable dictionary.
     """
-    return json.loads(result.model_dump_json())
+    return result.model_dump(mode="json")
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import base64
 from typing import TYPE_CHECKING, Any
 
 try:
@@ -70,12 +69,11 @@ def render_pdf_pages(  # noqa: PLR0913
                 page = doc.load_page(idx)
                 pix = page.get_pixmap(dpi=dpi)
                 image_bytes = pix.tobytes(output=normalized_format)
-                encoded = base64.b64encode(image_bytes).decode("ascii")
                 rendered.append(
                     RenderedPage(
                         page_number=idx + 1,
                         mime_type=_MIME_BY_FORMAT[normalized_format],
-                        data_base64=encoded,
+                        data=image_bytes,
                     ),
                 )
                 if max_pages and len(rendered) >= max_pages:
@@ -2,14 +2,29 @@
 
 from __future__ import annotations
 
+import re
 from decimal import Decimal, InvalidOperation
 from typing import TYPE_CHECKING
 
 from extractforms.typing.enums import FieldKind, FieldSemanticType
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from extractforms.typing.models import SchemaField
 
+type _Normalizer = Callable[[str], str]
+
+# Plain ASCII decimals with at most 15 digits round-trip exactly through a binary float.
+_PLAIN_DECIMAL = re.compile(r"[+-]?(?=\.?[0-9])[0-9]*\.?[0-9]*")
+_FLOAT_EXACT_DIGITS = 15
+
+_PHONE_ASCII_NOISE = str.maketrans(
+    "",
+    "",
+    "".join(chr(code) for code in range(128) if not chr(code).isdigit() and chr(code) != "+"),
+)
+
 
 def normalize_typed_value(
     *,
@@ -31,26 +46,17 @@ def normalize_typed_value(
     if not stripped or stripped == null_sentinel:
         return null_sentinel
 
-    semantic_type = schema_field.semantic_type
-    kind = schema_field.kind
-    normalized = stripped
-
-    if semantic_type == FieldSemanticType.PHONE or kind == FieldKind.PHONE:
-        normalized = _normalize_phone(stripped)
-    elif semantic_type == FieldSemanticType.AMOUNT or kind == FieldKind.AMOUNT:
-        normalized = _normalize_decimal(stripped)
-    elif semantic_type == FieldSemanticType.PERCENTAGE:
-        normalized = _normalize_percentage(stripped)
-    elif semantic_type == FieldSemanticType.ADDRESS or kind == FieldKind.ADDRESS:
-        normalized = " ".join(stripped.split())
-    elif semantic_type == FieldSemanticType.EMAIL or kind == FieldKind.EMAIL:
-        normalized = stripped.lower()
-
-    return normalized
+    normalizer = _NORMALIZERS.get((schema_field.semantic_type, schema_field.kind))
+    if normalizer is None:
+        return stripped
+    return normalizer(stripped)
 
 
 def _normalize_phone(value: str) -> str:
-    compact = "".join(ch for ch in value if ch.isdigit() or ch == "+")
+    if value.isascii():
+        compact = value.translate(_PHONE_ASCII_NOISE)
+    else:
+        compact = "".join(ch for ch in value if ch.isdigit() or ch == "+")
     if compact.startswith("00"):
         return "+" + compact[2:]
     if compact.count("+") > 1:
@@ -60,6 +66,9 @@ def _normalize_phone(value: str) -> str:
 
 def _normalize_decimal(value: str) -> str:
     compact = value.replace(" ", "").replace(",", ".")
+    fast = _normalize_plain_decimal(compact)
+    if fast is not None:
+        return fast
     try:
         number = Decimal(compact)
     except InvalidOperation:
@@ -70,7 +79,55 @@ def _normalize_decimal(value: str) -> str:
     return normalized
 
 
+def _normalize_plain_decimal(compact: str) -> str | None:
+    """Normalize short plain decimals through `float` instead of `Decimal`.
+
+    Args:
+        compact (str): Decimal candidate without spaces and with `.` separator.
+
+    Returns:
+        str | None: Normalized value, or None when the `Decimal` path is required.
+    """
+    if not _PLAIN_DECIMAL.fullmatch(compact):
+        return None
+    if len(compact.lstrip("+-").replace(".", "")) > _FLOAT_EXACT_DIGITS:
+        return None
+    text = repr(float(compact))
+    if "e" in text:
+        return None
+    return text.rstrip("0").rstrip(".")
+
+
 def _normalize_percentage(value: str) -> str:
     compact = value.replace("%", "").strip()
     normalized = _normalize_decimal(compact)
     return f"{normalized}%"
+
+
+def _collapse_whitespace(value: str) -> str:
+    return " ".join(value.split())
+
+
+# Ordered rules: the first rule matching either the semantic type or the kind wins.
+_NORMALIZER_RULES: tuple[tuple[FieldSemanticType, FieldKind | None, _Normalizer], ...] = (
+    (FieldSemanticType.PHONE, FieldKind.PHONE, _normalize_phone),
+    (FieldSemanticType.AMOUNT, FieldKind.AMOUNT, _normalize_decimal),
+    (FieldSemanticType.PERCENTAGE, None, _normalize_percentage),
+    (FieldSemanticType.ADDRESS, FieldKind.ADDRESS, _collapse_whitespace),
+    (FieldSemanticType.EMAIL, FieldKind.EMAIL, str.lower),
+)
+
+
+def _resolve_normalizer(semantic_type: FieldSemanticType | None, kind: FieldKind) -> _Normalizer | None:
+    for rule_semantic_type, rule_kind, normalizer in _NORMALIZER_RULES:
+        if semantic_type == rule_semantic_type or (rule_kind is not None and kind == rule_kind):
+            return normalizer
+    return None
+
+
+_NORMALIZERS: dict[tuple[FieldSemanticType | None, FieldKind], _Normalizer] = {
+    (semantic_type, kind): normalizer
+    for semantic_type in (None, *FieldSemanticType)
+    for kind in FieldKind
+    if (normalizer := _resolve_normalizer(semantic_type, kind)) is not None
+}
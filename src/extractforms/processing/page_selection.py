@@ -10,6 +10,8 @@ from extractforms import logger
 from extractforms.typing.models import PageSelectionAnalysis, PageSelectionRequest
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from extractforms.typing.models import RenderedPage, SchemaSpec
 
 
@@ -25,7 +27,7 @@ def analyze_page_selection(request: PageSelectionRequest) -> PageSelectionAnalys
     try:
         with fitz.open(request.pdf_path) as doc:
             selected_page_numbers = _compute_selected_page_numbers(doc, request)
-            nonblank_page_numbers = [
+            nonblank_page_numbers = tuple(
                 page_number
                 for page_number in selected_page_numbers
                 if _is_nonblank_page(
@@ -35,7 +37,7 @@ def analyze_page_selection(request: PageSelectionRequest) -> PageSelectionAnalys
                     ink_ratio_threshold=request.ink_ratio_threshold,
                     sample_dpi=request.sample_dpi,
                 )
-            ]
+            )
     except Exception:
         logger.warning("Failed to analyze blank pages", extra={"input_path": str(request.pdf_path)})
         return None
@@ -49,7 +51,7 @@ def analyze_page_selection(request: PageSelectionRequest) -> PageSelectionAnalys
 def _compute_selected_page_numbers(
     doc: fitz.Document,
     request: PageSelectionRequest,
-) -> list[int]:
+) -> tuple[int, ...]:
     """Compute selected page numbers for a PDF document.
 
     Args:
@@ -57,18 +59,18 @@ def _compute_selected_page_numbers(
         request (PageSelectionRequest): Selection request.
 
     Returns:
-        list[int]: Selected page numbers in ascending order.
+        tuple[int, ...]: Selected page numbers in ascending order.
     """
     total_pages = len(doc)
     if total_pages <= 0:
-        return []
+        return ()
 
     first_page = max(1, request.page_start or 1)
     last_page = min(request.page_end or total_pages, total_pages)
     if first_page > last_page:
-        return []
+        return ()
 
-    selected = list(range(first_page, last_page + 1))
+    selected = tuple(range(first_page, last_page + 1))
     if request.max_pages is not None:
         selected = selected[: request.max_pages]
     return selected
@@ -130,13 +132,13 @@ def _count_ink_pixels(rgb_samples: bytes, near_white_level: int) -> int:
 def filter_rendered_pages_to_nonblank(
     pages: list[RenderedPage],
     *,
-    nonblank_page_numbers: list[int],
+    nonblank_page_numbers: Sequence[int],
 ) -> list[RenderedPage]:
     """Filter rendered pages to keep only non-blank page numbers.
 
     Args:
         pages (list[RenderedPage]): Rendered pages.
-        nonblank_page_numbers (list[int]): Non-blank page numbers (1-based).
+        nonblank_page_numbers (Sequence[int]): Non-blank page numbers (1-based).
 
     Returns:
         list[RenderedPage]: Filtered page list.
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
-from typing import Any, cast
+import copy
+import json
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, cast
 
 from extractforms.typing.models import SanitizedJsonSchema, SchemaSpec
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from pydantic import BaseModel
+
 
 def sanitize_json_schema(schema: dict[str, Any]) -> dict[str, Any]:
     """Sanitize a JSON schema to maximize strict compatibility.
@@ -17,9 +24,12 @@ def sanitize_json_schema(schema: dict[str, Any]) -> dict[str, Any]:
     Returns:
         dict[str, Any]: Sanitized JSON schema.
     """
-    cleaned = deepcopy(schema)
+    # Schemas are plain JSON trees, so a JSON round-trip is a cheaper deep copy.
+    cleaned = cast("dict[str, Any]", json.loads(json.dumps(schema)))
 
-    def _walk(node: object) -> None:
+    stack: list[object] = [cleaned]
+    while stack:
+        node = stack.pop()
         if isinstance(node, dict):
             node_dict = cast("dict[str, Any]", node)
             if "properties" in node_dict:
@@ -27,17 +37,15 @@ def sanitize_json_schema(schema: dict[str, Any]) -> dict[str, Any]:
                 props = node_dict["properties"]
                 if isinstance(props, dict):
                     props_dict = cast("dict[str, Any]", props)
-                    node_dict["required"] = sorted(str(key) for key in props_dict)
+                    # Keys are already strings after the JSON round-trip; keep declaration order.
+                    node_dict["required"] = list(props_dict)
                     node_dict["additionalProperties"] = False
             if "$ref" in node_dict and "default" in node_dict:
                 node_dict.pop("default", None)
-            for value in node_dict.values():
-                _walk(value)
+            stack.extend(value for value in node_dict.values() if isinstance(value, (dict, list)))
         elif isinstance(node, list):
-            for item in node:
-                _walk(item)
+            stack.extend(item for item in node if isinstance(item, (dict, list)))
 
-    _walk(cleaned)
     return cleaned
 
 
@@ -58,6 +66,53 @@ def schema_response_format(name: str, schema: dict[str, Any]) -> SanitizedJsonSc
     )
 
 
+@lru_cache(maxsize=16)
+def model_response_format(name: str, model: type[BaseModel]) -> SanitizedJsonSchema:
+    """Build the strict response format of a response model once per model.
+
+    Args:
+        name (str): Schema name in response format.
+        model (type[BaseModel]): Pydantic model describing the expected response.
+
+    Returns:
+        SanitizedJsonSchema: Cached strict response schema wrapper.
+    """
+    return schema_response_format(name, model.model_json_schema())
+
+
+def model_response_format_payload(name: str, model: type[BaseModel]) -> dict[str, Any]:
+    """Return the chat completion ``response_format`` entry of a response model.
+
+    The payload is serialized once per model; each call returns a deep copy, so callers may
+    mutate it without affecting later requests.
+
+    Args:
+        name (str): Schema name in response format.
+        model (type[BaseModel]): Pydantic model describing the expected response.
+
+    Returns:
+        dict[str, Any]: ``response_format`` payload owned by the caller.
+    """
+    return copy.deepcopy(_serialized_response_format_payload(name, model))
+
+
+@lru_cache(maxsize=16)
+def _serialized_response_format_payload(name: str, model: type[BaseModel]) -> dict[str, Any]:
+    """Serialize the ``response_format`` entry of a response model once per model.
+
+    Args:
+        name (str): Schema name in response format.
+        model (type[BaseModel]): Pydantic model describing the expected response.
+
+    Returns:
+        dict[str, Any]: Shared payload, never handed out directly.
+    """
+    return {
+        "type": "json_schema",
+        "json_schema": model_response_format(name, model).model_dump(mode="json", by_alias=True),
+    }
+
+
 def build_schema_inference_prompt(*, extra_instructions: str | None = None) -> str:
     """Build prompt used to infer a document schema.
 
@@ -87,13 +142,51 @@ def build_values_extraction_prompt(schema: SchemaSpec, *, extra_instructions: st
     Returns:
         str: Prompt text.
     """
-    keys = ", ".join(field.key for field in schema.fields)
-    base = (
+    return build_keys_extraction_prompt(_schema_keys(schema), extra_instructions=extra_instructions)
+
+
+@lru_cache(maxsize=64)
+def _schema_keys(schema: SchemaSpec) -> tuple[str, ...]:
+    """Return the field keys of a schema, in schema order.
+
+    Args:
+        schema (SchemaSpec): Input schema.
+
+    Returns:
+        tuple[str, ...]: Field keys.
+    """
+    return tuple(field.key for field in schema.fields)
+
+
+def build_keys_extraction_prompt(keys: Sequence[str], *, extra_instructions: str | None = None) -> str:
+    """Build prompt used to extract values for a list of keys.
+
+    Args:
+        keys (Sequence[str]): Keys to extract, in schema order.
+        extra_instructions (str | None): Optional user instructions.
+
+    Returns:
+        str: Prompt text.
+    """
+    base = _values_extraction_prompt_base(tuple(keys))
+    if extra_instructions:
+        return f"{base}\nAdditional instructions: {extra_instructions}"
+    return base
+
+
+@lru_cache(maxsize=64)
+def _values_extraction_prompt_base(keys: tuple[str, ...]) -> str:
+    """Build the values extraction prompt body for a key set.
+
+    Args:
+        keys (tuple[str, ...]): Keys to extract, in schema order.
+
+    Returns:
+        str: Prompt text without extra instructions.
+    """
+    return (
         "Extract values for the following keys. "
         "When a value is missing return the NULL sentinel. "
         "Use the real PDF order for page numbering (1-based) and ignore printed page labels. "
-        f"Keys: {keys}."
+        f"Keys: {', '.join(keys)}."
     )
-    if extra_instructions:
-        return f"{base}\nAdditional instructions: {extra_instructions}"
-    return base
@@ -2,20 +2,39 @@
 
 from __future__ import annotations
 
+import glob
 import hashlib
 import json
+import mmap
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import cast
+from typing import TYPE_CHECKING, cast
 from uuid import uuid4
 
-from pydantic import BaseModel, ConfigDict, Field
+try:
+    import blake3
+except ImportError:  # pragma: no cover - optional dependency
+    blake3 = None
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from extractforms import logger
-from extractforms.exceptions import SchemaStoreError
+from extractforms.exceptions import DependencyError, SchemaStoreError
+from extractforms.typing.enums import FingerprintAlgorithm
 from extractforms.typing.models import MatchResult, SchemaField, SchemaSpec
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+
 _SCHEMA_FILE_VERSION = 2
+_FINGERPRINT_INDEX_FILE = "fingerprint_index.json"
+_UNSAFE_NAME_CHARS = re.compile(r"[^a-z0-9._-]+")
+_MMAP_DIGEST_MIN_BYTES = 16 * 1024 * 1024
+_PARALLEL_LOAD_MIN_FILES = 4
+_PARALLEL_LOAD_MAX_WORKERS = 8
 
 
 class SchemaStore(BaseModel):
@@ -24,6 +43,7 @@ class SchemaStore(BaseModel):
     model_config = ConfigDict(extra="forbid", arbitrary_types_allowed=True)
 
     root: Path = Field(description="Cache directory root.")
+    _index_cache: tuple[int, dict[str, list[str]]] | None = PrivateAttr(default=None)
 
     def model_post_init(self, __context: object, /) -> None:
         """Ensure the cache directory exists after model initialization.
@@ -34,20 +54,33 @@ class SchemaStore(BaseModel):
         self.root.mkdir(parents=True, exist_ok=True)
 
     @staticmethod
-    def fingerprint_pdf(pdf_path: Path) -> str:
+    def fingerprint_pdf(
+        pdf_path: Path,
+        algorithm: FingerprintAlgorithm = FingerprintAlgorithm.SHA256,
+    ) -> str:
         """Compute stable PDF fingerprint.
 
         Args:
             pdf_path (Path): Input PDF path.
+            algorithm (FingerprintAlgorithm): Content hash algorithm.
+
+        Raises:
+            DependencyError: If BLAKE3 is requested but the `blake3` package is missing.
 
         Returns:
-            str: SHA-256 hex digest.
+            str: Hex digest of the file content.
         """
-        digest = hashlib.sha256()
+        if algorithm == FingerprintAlgorithm.BLAKE3:
+            if blake3 is None:
+                raise DependencyError(missing_package=["blake3"], message="blake3 fingerprinting")
+            return blake3.blake3(max_threads=blake3.blake3.AUTO).update_mmap(pdf_path).hexdigest()
+
         with pdf_path.open("rb") as handle:
-            for chunk in iter(lambda: handle.read(8192), b""):
-                digest.update(chunk)
-        return digest.hexdigest()
+            if os.fstat(handle.fileno()).st_size >= _MMAP_DIGEST_MIN_BYTES:
+                # Large files are hashed straight from the page cache instead of read() buffers.
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return hashlib.sha256(mapped).hexdigest()
+            return hashlib.file_digest(handle, "sha256").hexdigest()
 
     def schema_path(
         self,
@@ -66,7 +99,7 @@ class SchemaStore(BaseModel):
         Returns:
             Path: Cache path.
         """
-        safe_name = re.sub(r"[^a-z0-9._-]+", "-", schema_name.lower()).strip("-")
+        safe_name = _UNSAFE_NAME_CHARS.sub("-", schema_name.lower()).strip("-")
         if not safe_name:
             safe_name = "schema"
         return self.root / f"{safe_name}-{schema_id}-{fingerprint}.schema.json"
@@ -82,7 +115,7 @@ class SchemaStore(BaseModel):
             SchemaSpec: Loaded schema.
         """
         _validate_schema_file_path(path)
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = json.loads(path.read_bytes())
         migrated = _migrate_schema_payload(payload)
         return SchemaSpec.model_validate(migrated)
 
@@ -104,10 +137,16 @@ class SchemaStore(BaseModel):
             "schema_file_version": _SCHEMA_FILE_VERSION,
             "schema": schema.model_dump(mode="json"),
         }
-        path.write_text(json.dumps(envelope, indent=2, sort_keys=True), encoding="utf-8")
+        path.write_bytes(json.dumps(envelope, indent=2, sort_keys=True).encode("utf-8"))
+        self._index_schema_file(schema.fingerprint, path)
         logger.info("Schema cached", extra={"schema_path": str(path)})
         return path
 
+    @property
+    def fingerprint_index_path(self) -> Path:
+        """Path of the fingerprint index file."""
+        return self.root / _FINGERPRINT_INDEX_FILE
+
     def list_schemas(self) -> list[Path]:
         """List cached schema files.
 
@@ -125,26 +164,249 @@ class SchemaStore(BaseModel):
         Returns:
             MatchResult: Match details.
         """
-        for path in self.list_schemas():
-            schema = self.load(path)
-            if schema.fingerprint == fingerprint:
-                return MatchResult(
-                    matched=True,
-                    schema_id=schema.id,
-                    score=1.0,
-                    reason="fingerprint_match",
-                )
+        found = self._find_fingerprint_match(fingerprint)
+        if found is None:
+            return MatchResult(matched=False, reason="no_match")
+        return MatchResult(
+            matched=True,
+            schema_id=found[1],
+            score=1.0,
+            reason="fingerprint_match",
+        )
+
+    def load_by_fingerprint(self, fingerprint: str) -> SchemaSpec | None:
+        """Load the cached schema matching a fingerprint.
+
+        Args:
+            fingerprint (str): PDF fingerprint.
+
+        Returns:
+            SchemaSpec | None: Matching schema, or None when no cached schema carries the fingerprint.
+        """
+        found = self._find_fingerprint_match(fingerprint)
+        if found is None:
+            return None
+        return self.load(found[0])
+
+    def _find_fingerprint_match(self, fingerprint: str) -> tuple[Path, str] | None:
+        """Find the first cached schema file carrying a fingerprint.
+
+        Args:
+            fingerprint (str): PDF fingerprint.
+
+        Returns:
+            tuple[Path, str] | None: Schema file path and schema id, or None when not found.
+        """
+        candidates = self._fingerprint_candidates(fingerprint)
+        read_identity = partial(_read_schema_identity, expected_fingerprint=fingerprint)
+        for path, identity in zip(candidates, _map_paths(read_identity, candidates), strict=True):
+            if identity is not None and identity[1] == fingerprint:
+                return path, identity[0]
+        return None
+
+    def _fingerprint_candidates(self, fingerprint: str) -> list[Path]:
+        """Return cached schema files that may hold a fingerprint.
+
+        Args:
+            fingerprint (str): PDF fingerprint.
+
+        Returns:
+            list[Path]: Candidate schema files, sorted by path.
+        """
+        index = self._read_fingerprint_index()
+        if index is None:
+            index = self._seed_fingerprint_index()
+        indexed = {self.root / name for name in index.get(fingerprint, [])}
+        # Cache file names end with the fingerprint, so the glob also finds schemas the
+        # index missed (copied in by hand, or dropped by a concurrent index write).
+        named = self.root.glob(f"*-{glob.escape(fingerprint)}.schema.json")
+        return sorted(path for path in indexed.union(named) if path.is_file())
+
+    def _read_fingerprint_index(self) -> dict[str, list[str]] | None:
+        """Read the fingerprint index, reusing the in-memory copy while unchanged.
+
+        Returns:
+            dict[str, list[str]] | None: Schema file names by fingerprint, or None when unavailable.
+        """
+        index_path = self.fingerprint_index_path
+        try:
+            mtime_ns = index_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+        if self._index_cache is not None and self._index_cache[0] == mtime_ns:
+            return self._index_cache[1]
+
+        try:
+            payload = json.loads(index_path.read_bytes())
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable fingerprint index", extra={"index_path": str(index_path)})
+            return None
+        if not isinstance(payload, dict):
+            return None
+
+        index = {
+            str(fingerprint): [str(name) for name in names]
+            for fingerprint, names in cast("dict[object, object]", payload).items()
+            if isinstance(names, list)
+        }
+        self._index_cache = (mtime_ns, index)
+        return index
+
+    def _build_fingerprint_index(self) -> dict[str, list[str]]:
+        """Build the fingerprint index by loading every cached schema once.
+
+        Returns:
+            dict[str, list[str]]: Schema file names by fingerprint.
+        """
+        paths = self.list_schemas()
+        index: dict[str, list[str]] = {}
+        for path, identity in zip(paths, _map_paths(_read_schema_identity_or_none, paths), strict=True):
+            if identity is not None:
+                index.setdefault(identity[1], []).append(path.name)
+        return index
+
+    def _seed_fingerprint_index(self) -> dict[str, list[str]]:
+        """Build the fingerprint index for a cache without one and persist it when possible.
+
+        Returns:
+            dict[str, list[str]]: Schema file names by fingerprint.
+        """
+        index = self._build_fingerprint_index()
+        try:
+            self._write_fingerprint_index(index)
+        except OSError:
+            logger.warning(
+                "Could not persist fingerprint index",
+                extra={"index_path": str(self.fingerprint_index_path)},
+            )
+        return index
+
+    def _index_schema_file(self, fingerprint: str, path: Path) -> None:
+        """Record a schema file in the fingerprint index.
+
+        Args:
+            fingerprint (str): Schema fingerprint.
+            path (Path): Written schema file path.
+        """
+        index = self._read_fingerprint_index()
+        index = self._build_fingerprint_index() if index is None else dict(index)
+
+        names = set(index.get(fingerprint, []))
+        names.add(path.name)
+        index[fingerprint] = sorted(names)
+        self._write_fingerprint_index(index)
+
+    def _write_fingerprint_index(self, index: dict[str, list[str]]) -> None:
+        """Atomically replace the fingerprint index file.
+
+        Args:
+            index (dict[str, list[str]]): Schema file names by fingerprint.
+        """
+        index_path = self.fingerprint_index_path
+        # A per-write temp name keeps concurrent writers from renaming each other's file away.
+        tmp_path = index_path.with_name(f"{index_path.name}.{uuid4().hex}.tmp")
+        try:
+            tmp_path.write_bytes(json.dumps(index, indent=2, sort_keys=True).encode("utf-8"))
+            tmp_path.replace(index_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        self._index_cache = None
+
+
+def _map_paths[T](func: Callable[[Path], T], paths: list[Path]) -> Iterator[T]:
+    """Apply a loader to paths in order, overlapping file I/O for larger batches.
+
+    Args:
+        func (Callable[[Path], T]): Per-path loader.
+        paths (list[Path]): Paths to load.
+
+    Yields:
+        T: Loader results, in `paths` order.
+    """
+    if len(paths) < _PARALLEL_LOAD_MIN_FILES:
+        yield from map(func, paths)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(_PARALLEL_LOAD_MAX_WORKERS, len(paths))) as pool:
+        futures = [pool.submit(func, path) for path in paths]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def _read_schema_identity(
+    path: Path,
+    *,
+    expected_fingerprint: str | None = None,
+) -> tuple[str, str] | None:
+    """Read schema id and fingerprint from raw JSON, without model validation.
+
+    Args:
+        path (Path): Schema file path.
+        expected_fingerprint (str | None): Optional fingerprint; files whose bytes cannot
+            contain it are skipped before JSON parsing.
 
-        return MatchResult(matched=False, reason="no_match")
+    Raises:
+        SchemaStoreError: If the payload has no string `id` and `fingerprint`.
+
+    Returns:
+        tuple[str, str] | None: Schema id and fingerprint, or None when skipped.
+    """
+    _validate_schema_file_path(path)
+    data = path.read_bytes()
+    if expected_fingerprint is not None and not _may_contain_fingerprint(data, expected_fingerprint):
+        return None
+    payload = _migrate_schema_payload(json.loads(data))
+    schema_id = payload.get("id")
+    fingerprint = payload.get("fingerprint")
+    if not isinstance(schema_id, str) or not isinstance(fingerprint, str):
+        raise SchemaStoreError(message=f"Schema payload must define string id and fingerprint: {path}")
+    return schema_id, fingerprint
+
+
+def _may_contain_fingerprint(data: bytes, fingerprint: str) -> bool:
+    """Return whether raw schema bytes may hold a fingerprint string.
+
+    Args:
+        data (bytes): Raw schema file content.
+        fingerprint (str): Expected fingerprint.
+
+    Returns:
+        bool: False only when the encoded fingerprint is provably absent.
+    """
+    # Plain ASCII alphanumerics (e.g. hex digests) encode identically with every JSON encoder.
+    if not (fingerprint.isascii() and fingerprint.isalnum()):
+        return True
+    return f'"{fingerprint}"'.encode("ascii") in data
+
+
+def _read_schema_identity_or_none(path: Path) -> tuple[str, str] | None:
+    """Read schema id and fingerprint, skipping unreadable files.
+
+    Args:
+        path (Path): Schema file path.
+
+    Returns:
+        tuple[str, str] | None: Schema id and fingerprint, or None when the file cannot be read.
+    """
+    try:
+        return _read_schema_identity(path)
+    except (SchemaStoreError, ValueError):
+        logger.warning("Skipping unreadable cached schema", extra={"schema_path": str(path)})
+        return None
 
 
-def build_schema_with_generated_id(name: str, fingerprint: str, fields: list[SchemaField]) -> SchemaSpec:
+def build_schema_with_generated_id(name: str, fingerprint: str, fields: Sequence[SchemaField]) -> SchemaSpec:
     """Create schema with generated UUID id.
 
     Args:
         name (str): Schema name.
         fingerprint (str): Source document fingerprint.
-        fields (list[SchemaField]): Schema fields.
+        fields (Sequence[SchemaField]): Schema fields.
 
     Returns:
         SchemaSpec: Generated schema.
@@ -156,21 +418,21 @@ def build_schema_with_generated_id(name: str, fingerprint: str, fields: list[Sch
         fingerprint=fingerprint,
         version=1,
         schema_family_id=schema_id,
-        fields=fields,
+        fields=tuple(fields),
     )
 
 
 def build_schema_revision(
     previous: SchemaSpec,
     *,
-    fields: list[SchemaField],
+    fields: Sequence[SchemaField],
     name: str | None = None,
 ) -> SchemaSpec:
     """Create a new schema revision from an existing schema.
 
     Args:
         previous (SchemaSpec): Existing schema.
-        fields (list[SchemaField]): Revised fields payload.
+        fields (Sequence[SchemaField]): Revised fields payload.
         name (str | None): Optional revised schema name.
 
     Returns:
@@ -183,7 +445,7 @@ def build_schema_revision(
         fingerprint=previous.fingerprint,
         version=previous.version + 1,
         schema_family_id=family_id,
-        fields=fields,
+        fields=tuple(fields),
     )
 
 
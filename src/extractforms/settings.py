@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
 import ipaddress
 import logging
 import re
 import ssl
+import threading
+from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 import certifi
 import httpx
@@ -18,20 +21,45 @@ from pydantic import Field, PrivateAttr, ValidationError, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from extractforms.exceptions import SettingsError
-from extractforms.typing.enums import ExtractionBackendType
+from extractforms.typing.enums import ExtractionBackendType, FingerprintAlgorithm
 
 NoProxyNetwork = ipaddress.IPv4Network | ipaddress.IPv6Network
 NoProxyRegex = re.Pattern[str]
+NoProxyRange = tuple[tuple[int, ...], tuple[int, ...]]
+NoProxyRanges = tuple[NoProxyRange, NoProxyRange]
+NoProxyMatchers = tuple[frozenset[str], tuple[str, ...], NoProxyRegex | None, tuple[NoProxyNetwork, ...]]
 logger = logging.getLogger(__name__)
 
+_NO_PROXY_MATCHERS_CACHE_SIZE = 8
+_SSL_CONTEXT_CACHE_SIZE = 4
+
+_URL_AUTHORITY = re.compile(r"[A-Za-z][A-Za-z0-9+.\-]*://([^/?#]*)")
+_URL_AUTHORITY_FALLBACK_CHARS = frozenset("%[] \t\r\n")
+_NO_PROXY_MATCH_ALL = re.compile(r".*")
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class _NoProxyMatcher:
+    """Compiled NO_PROXY matchers of one Settings instance.
+
+    Equality and hashing are by identity, so host decision cache keys hash in constant time.
+    """
+
+    hosts: frozenset[str] = frozenset()
+    suffixes: tuple[str, ...] = ()
+    wildcard: NoProxyRegex | None = None
+    ranges: NoProxyRanges = (((), ()), ((), ()))
+
 
 class Settings(BaseSettings):
     """Package settings."""
 
+    # Frozen: NO_PROXY matchers, TLS context, and HTTPX clients are derived once per instance.
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        frozen=True,
     )
 
     project_name: str = "extractforms"
@@ -136,6 +164,11 @@ class Settings(BaseSettings):
         validation_alias="SCHEMA_CACHE_DIR",
         description="Directory to cache schemas.",
     )
+    fingerprint_algorithm: FingerprintAlgorithm = Field(
+        default=FingerprintAlgorithm.SHA256,
+        validation_alias="FINGERPRINT_ALGORITHM",
+        description="Document fingerprint hash (`sha256` or `blake3`, which needs the `blake3` package).",
+    )
     null_sentinel: str = Field(
         default="NULL",
         validation_alias="NULL_SENTINEL",
@@ -160,10 +193,12 @@ class Settings(BaseSettings):
         ge=0,
         le=255,
     )
-    _no_proxy_regex: NoProxyRegex | None = PrivateAttr(default=None)
+    _no_proxy_matcher: _NoProxyMatcher = PrivateAttr(default_factory=_NoProxyMatcher)
     _no_proxy_networks: tuple[NoProxyNetwork, ...] = PrivateAttr(default=())
+    _no_proxy_empty: bool = PrivateAttr(default=True)
+    _ssl_context: ssl.SSLContext | None = PrivateAttr(default=None)
     _httpx_clients: dict[str, object] = PrivateAttr(default_factory=dict)
-    _close_tasks: set[asyncio.Task[None]] = PrivateAttr(default_factory=set)
+    _httpx_clients_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
 
     @field_validator("openai_base_url")
     @classmethod
@@ -186,7 +221,7 @@ class Settings(BaseSettings):
         if not stripped:
             return value
 
-        parsed = urlparse(stripped)
+        parsed = urlsplit(stripped)
         if parsed.scheme not in {"http", "https"}:
             raise ValueError("OPENAI_BASE_URL must use http or https scheme")  # noqa: TRY003
         if not parsed.hostname:
@@ -197,78 +232,130 @@ class Settings(BaseSettings):
 
     def model_post_init(self, __context: object, /) -> None:
         """Initialize derived runtime settings."""
-        self._no_proxy_regex, self._no_proxy_networks = compile_no_proxy_matchers(self.no_proxy)
-        self._initialize_httpx_clients()
+        hosts, suffixes, wildcard, self._no_proxy_networks = compile_no_proxy_matchers(self.no_proxy)
+        self._no_proxy_matcher = _NoProxyMatcher(
+            hosts=hosts,
+            suffixes=suffixes,
+            wildcard=wildcard,
+            ranges=_merge_network_ranges(self._no_proxy_networks),
+        )
+        self._no_proxy_empty = not (hosts or suffixes or wildcard or self._no_proxy_networks)
+
+    @property
+    def no_proxy_hosts(self) -> frozenset[str]:
+        """Return exact NO_PROXY hosts."""
+        return self._no_proxy_matcher.hosts
+
+    @property
+    def no_proxy_suffixes(self) -> tuple[str, ...]:
+        """Return NO_PROXY host suffixes matched with `str.endswith`."""
+        return self._no_proxy_matcher.suffixes
 
     @property
     def no_proxy_regex(self) -> NoProxyRegex | None:
-        """Return compiled NO_PROXY regex."""
-        return self._no_proxy_regex
+        """Return compiled NO_PROXY wildcard regex."""
+        return self._no_proxy_matcher.wildcard
+
+    @property
+    def no_proxy_ranges(self) -> NoProxyRanges:
+        """Return NO_PROXY networks as merged IPv4 and IPv6 integer ranges."""
+        return self._no_proxy_matcher.ranges
+
+    @property
+    def no_proxy_empty(self) -> bool:
+        """Return whether NO_PROXY configures no matcher."""
+        return self._no_proxy_empty
 
     @property
     def no_proxy_networks(self) -> tuple[NoProxyNetwork, ...]:
         """Return parsed NO_PROXY CIDR networks."""
         return self._no_proxy_networks
 
+    @property
+    def proxy_url(self) -> str | None:
+        """Return the proxy URL used for proxied clients (HTTPS, then HTTP, then ALL proxy)."""
+        return self.https_proxy or self.http_proxy or self.all_proxy
+
+    @property
+    def ssl_context(self) -> ssl.SSLContext:
+        """Return the TLS context shared by HTTPX clients, built on first use."""
+        if self._ssl_context is None:
+            self._ssl_context = build_ssl_context(self)
+        return self._ssl_context
+
     @property
     def httpx_clients(self) -> dict[str, object]:
-        """Return cached HTTPX clients."""
+        """Return HTTPX clients created so far."""
         return self._httpx_clients
 
     def should_bypass_proxy(self, target_url: str | None) -> bool:
         """Return whether the URL should bypass proxies."""
+        if self._no_proxy_empty or not target_url:
+            return False
         return _is_no_proxy_target(target_url, self)
 
     def select_sync_httpx_client(self, target_url: str | None) -> object | None:
-        """Return sync HTTPX client selected for target URL."""
-        if not self._httpx_clients:
-            return None
+        """Return sync HTTPX client selected for target URL, creating it on first use."""
         if self.should_bypass_proxy(target_url):
-            return self._httpx_clients["sync_no_proxy"]
-        return self._httpx_clients["sync_proxy"]
+            return self._get_httpx_client("sync_no_proxy")
+        return self._get_httpx_client("sync_proxy")
 
     def select_async_httpx_client(self, target_url: str | None) -> object | None:
-        """Return async HTTPX client selected for target URL."""
-        if not self._httpx_clients:
-            return None
+        """Return async HTTPX client selected for target URL, creating it on first use."""
         if self.should_bypass_proxy(target_url):
-            return self._httpx_clients["async_no_proxy"]
-        return self._httpx_clients["async_proxy"]
-
-    def _initialize_httpx_clients(self) -> None:
-        """Create and cache sync/async HTTPX clients for proxy and no-proxy paths."""
-        sync_proxy_kwargs = build_httpx_client_kwargs(self)
-        sync_no_proxy_kwargs = build_httpx_client_kwargs(self, force_no_proxy=True)
-        limits = httpx.Limits(max_connections=self.max_connections)
-
-        self._httpx_clients = {
-            "sync_proxy": httpx.Client(**sync_proxy_kwargs, limits=limits),
-            "sync_no_proxy": httpx.Client(**sync_no_proxy_kwargs, limits=limits),
-            "async_proxy": httpx.AsyncClient(**sync_proxy_kwargs, limits=limits),
-            "async_no_proxy": httpx.AsyncClient(**sync_no_proxy_kwargs, limits=limits),
-        }
+            return self._get_httpx_client("async_no_proxy")
+        return self._get_httpx_client("async_proxy")
+
+    def _get_httpx_client(self, key: str) -> object:
+        """Return the cached HTTPX client for a lane, creating it on first use.
+
+        Args:
+            key (str): Client key (`sync_proxy`, `sync_no_proxy`, `async_proxy`, `async_no_proxy`).
+
+        Returns:
+            object: Cached `httpx.Client` or `httpx.AsyncClient`.
+        """
+        client = self._httpx_clients.get(key)
+        if client is not None:
+            return client
+
+        # Client construction never awaits, so one thread lock also covers async callers.
+        with self._httpx_clients_lock:
+            client = self._httpx_clients.get(key)
+            if client is None:
+                if key.endswith("_no_proxy"):
+                    kwargs = build_direct_httpx_client_kwargs(self)
+                else:
+                    kwargs = build_proxy_httpx_client_kwargs(self)
+                limits = httpx.Limits(max_connections=self.max_connections)
+                client_cls = httpx.AsyncClient if key.startswith("async_") else httpx.Client
+                client = client_cls(**kwargs, limits=limits)
+                self._httpx_clients[key] = client
+        return client
 
     def close_httpx_clients(self) -> None:
-        """Close cached sync/async HTTPX clients (best effort)."""
+        """Close cached sync/async HTTPX clients (best effort) from synchronous code.
+
+        Raises:
+            RuntimeError: If called while an event loop is running; await
+                `aclose_httpx_clients()` there instead.
+        """
         if not self._httpx_clients:
             return
 
-        self._close_sync_clients(("sync_proxy", "sync_no_proxy"))
-        async_clients = (
-            ("async_proxy", self._httpx_clients.get("async_proxy")),
-            ("async_no_proxy", self._httpx_clients.get("async_no_proxy")),
-        )
+        async_clients = self._created_async_clients()
+        if async_clients:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+            else:
+                raise RuntimeError("use `await settings.aclose_httpx_clients()` inside a running event loop")  # noqa: TRY003
 
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
+        self._close_sync_clients(("sync_proxy", "sync_no_proxy"))
+        if async_clients:
             asyncio.run(self._aclose_async_clients(async_clients))
-        else:
-            task = loop.create_task(self._aclose_async_clients(async_clients))
-            self._close_tasks.add(task)
-            task.add_done_callback(self._on_close_task_done)
-
-        self._httpx_clients = {}
+        self._httpx_clients.clear()
 
     async def aclose_httpx_clients(self) -> None:
         """Asynchronously close cached sync/async HTTPX clients."""
@@ -276,14 +363,17 @@ class Settings(BaseSettings):
             return
 
         self._close_sync_clients(("sync_proxy", "sync_no_proxy"))
-        await self._aclose_async_clients(
-            (
-                ("async_proxy", self._httpx_clients.get("async_proxy")),
-                ("async_no_proxy", self._httpx_clients.get("async_no_proxy")),
-            ),
-        )
+        await self._aclose_async_clients(self._created_async_clients())
+
+        self._httpx_clients.clear()
 
-        self._httpx_clients = {}
+    def _created_async_clients(self) -> tuple[tuple[str, object], ...]:
+        """Return async HTTPX clients created so far, keyed by lane."""
+        return tuple(
+            (key, client)
+            for key in ("async_proxy", "async_no_proxy")
+            if (client := self._httpx_clients.get(key)) is not None
+        )
 
     def _close_sync_clients(self, keys: tuple[str, ...]) -> None:
         """Close sync HTTPX clients with best effort."""
@@ -299,7 +389,7 @@ class Settings(BaseSettings):
 
     @staticmethod
     async def _aclose_async_clients(
-        clients: tuple[tuple[str, object | None], ...],
+        clients: tuple[tuple[str, object], ...],
     ) -> None:
         """Close async HTTPX clients with best effort."""
         for key, client in clients:
@@ -311,14 +401,6 @@ class Settings(BaseSettings):
             except Exception:
                 logger.warning("Failed to close async HTTPX client", extra={"client_key": key})
 
-    def _on_close_task_done(self, task: asyncio.Task[None]) -> None:
-        """Handle completion of async close tasks."""
-        self._close_tasks.discard(task)
-        try:
-            task.result()
-        except Exception:
-            logger.warning("Async HTTPX close task failed")
-
 
 def build_ssl_context(settings: Settings) -> ssl.SSLContext:
     """Build a strict SSL context from settings.
@@ -329,8 +411,24 @@ def build_ssl_context(settings: Settings) -> ssl.SSLContext:
     Returns:
         ssl.SSLContext: Configured TLS context.
     """
-    if settings.cert_path:
-        ssl_context = ssl.create_default_context(cafile=settings.cert_path)
+    return _build_ssl_context(settings.cert_path)
+
+
+@lru_cache(maxsize=_SSL_CONTEXT_CACHE_SIZE)
+def _build_ssl_context(cert_path: str | None) -> ssl.SSLContext:
+    """Build a strict SSL context, cached per CA bundle path.
+
+    Settings sharing a `CERT_PATH` share one context, so CA bundles are parsed once per
+    process; CA files changed on disk are picked up after `cache_clear()` only.
+
+    Args:
+        cert_path (str | None): CA bundle path, or None for the host trust store.
+
+    Returns:
+        ssl.SSLContext: Configured TLS context.
+    """
+    if cert_path:
+        ssl_context = ssl.create_default_context(cafile=cert_path)
     else:
         ssl_context = ssl.create_default_context()
         if not _cert_store_has_ca(ssl_context):
@@ -396,35 +494,70 @@ def _normalize_no_proxy_host(entry: str) -> str:
     """
     candidate = entry.lower().strip()
     if "://" in candidate:
-        candidate = (urlparse(candidate).hostname or "").lower()
+        if candidate.startswith("//"):
+            authority = candidate[2 : _authority_end(candidate[2:]) + 2]
+        else:
+            match = _URL_AUTHORITY.match(candidate)
+            authority = match.group(1) if match else ""
+        candidate = _authority_host(authority)
     else:
-        parsed = urlparse(f"//{candidate}")
-        if parsed.hostname:
-            candidate = parsed.hostname.lower()
+        authority = candidate[: _authority_end(candidate)]
+        candidate = _authority_host(authority) or candidate
     return candidate.strip("[]").removeprefix(".")
 
 
-def _compile_no_proxy_regex(no_proxy: str | None) -> NoProxyRegex | None:
-    """Compile NO_PROXY host/wildcard entries as one regex.
+def _authority_end(value: str) -> int:
+    """Return the index where a URL authority stops (first `/`, `?` or `#`).
+
+    Args:
+        value (str): Text starting with a URL authority.
+
+    Returns:
+        int: End index of the authority.
+    """
+    ends = [index for index in (value.find(char) for char in "/?#") if index >= 0]
+    return min(ends, default=len(value))
+
+
+def _authority_host(authority: str) -> str:
+    """Return the host part of a URL authority, without userinfo, port, or IPv6 brackets.
+
+    Args:
+        authority (str): URL authority (`[user@]host[:port]`).
+
+    Returns:
+        str: Host, or an empty string when the authority has none.
+    """
+    host = authority.rpartition("@")[2]
+    if "[" in host:
+        return host.partition("[")[2].partition("]")[0]
+    return host.partition(":")[0]
+
+
+@lru_cache(maxsize=_NO_PROXY_MATCHERS_CACHE_SIZE)
+def compile_no_proxy_matchers(no_proxy: str | None) -> NoProxyMatchers:
+    """Compile NO_PROXY entries into host, suffix, wildcard and network matchers.
+
+    Plain hosts match themselves and their subdomains, `.domain` matches subdomains only, and
+    `*` matches every host. Entries are lowercased, and results are cached per raw value.
 
     Args:
         no_proxy (str | None): Raw NO_PROXY value.
 
     Returns:
-        NoProxyRegex | None: Compiled regex for host matching.
+        NoProxyMatchers: Exact hosts, host suffixes, wildcard regex, and networks.
     """
     entries = _iter_no_proxy_entries(no_proxy)
-    if not entries:
-        return None
+    if "*" in entries:
+        return frozenset(), (), _NO_PROXY_MATCH_ALL, ()
 
-    regex_parts: list[str] = []
+    hosts: set[str] = set()
+    suffixes: dict[str, None] = {}
+    wildcard_parts: dict[str, None] = {}
+    networks: list[NoProxyNetwork] = []
     for entry in entries:
-        subdomain_only = entry.startswith(".")
-        if entry == "*":
-            return re.compile(r"^.*$", re.IGNORECASE)
-
         try:
-            ipaddress.ip_network(entry, strict=False)
+            networks.append(ipaddress.ip_network(entry, strict=False))
             continue
         except ValueError:
             pass
@@ -433,77 +566,170 @@ def _compile_no_proxy_regex(no_proxy: str | None) -> NoProxyRegex | None:
         if not host_pattern:
             continue
 
-        escaped = re.escape(host_pattern).replace(r"\*", ".*")
-        if "*" in host_pattern or re.fullmatch(r"\d+\.\d+\.\d+\.\d+", host_pattern):
-            regex_parts.append(escaped)
-        elif subdomain_only:
-            regex_parts.append(rf"(?:.*\.){escaped}")
+        if host_pattern.startswith("*") and "*" not in host_pattern[1:]:
+            suffixes[host_pattern[1:]] = None
+        elif "*" in host_pattern:
+            wildcard_parts[re.escape(host_pattern).replace(r"\*", ".*")] = None
+        elif re.fullmatch(r"\d+\.\d+\.\d+\.\d+", host_pattern):
+            hosts.add(host_pattern)
+        elif entry.startswith("."):
+            suffixes[f".{host_pattern}"] = None
         else:
-            regex_parts.append(rf"(?:{escaped}|(?:.*\.){escaped})")
+            hosts.add(host_pattern)
+            suffixes[f".{host_pattern}"] = None
 
-    if not regex_parts:
-        return None
-    return re.compile(rf"^(?:{'|'.join(regex_parts)})$", re.IGNORECASE)
+    wildcard = re.compile(f"(?:{'|'.join(wildcard_parts)})") if wildcard_parts else None
+    return frozenset(hosts), tuple(suffixes), wildcard, tuple(networks)
 
 
-def _parse_no_proxy_networks(no_proxy: str | None) -> tuple[NoProxyNetwork, ...]:
-    """Parse CIDR entries from NO_PROXY.
+def _is_no_proxy_target(target_url: str | None, settings: Settings) -> bool:
+    """Return whether the target URL should bypass proxies.
 
     Args:
-        no_proxy (str | None): Raw NO_PROXY value.
+        target_url (str | None): Target request URL.
+        settings (Settings): Runtime settings.
 
     Returns:
-        tuple[NoProxyNetwork, ...]: Parsed networks.
+        bool: True when proxy must be bypassed.
     """
-    networks: list[NoProxyNetwork] = []
-    for entry in _iter_no_proxy_entries(no_proxy):
-        try:
-            network = ipaddress.ip_network(entry, strict=False)
-        except ValueError:
-            continue
-        networks.append(network)
-    return tuple(networks)
+    if not target_url:
+        return False
+    if settings.no_proxy_empty:
+        return False
+
+    host = _extract_host(target_url)
+    if not host:
+        return False
 
+    return _host_bypasses_proxy(host, settings._no_proxy_matcher)  # noqa: SLF001
 
-def compile_no_proxy_matchers(no_proxy: str | None) -> tuple[NoProxyRegex | None, tuple[NoProxyNetwork, ...]]:
-    """Compile NO_PROXY regex and CIDR networks.
+
+def _extract_host(url: str) -> str | None:
+    """Return the normalized host of a URL.
 
     Args:
-        no_proxy (str | None): Raw NO_PROXY value.
+        url (str): URL to inspect.
 
     Returns:
-        tuple[NoProxyRegex | None, tuple[NoProxyNetwork, ...]]: Compiled host regex and networks.
+        str | None: Lowercase host without IPv6 brackets, or None when the URL has none.
     """
-    return _compile_no_proxy_regex(no_proxy), _parse_no_proxy_networks(no_proxy)
+    hostname = _fast_hostname(url)
+    if not hostname:
+        return None
+    return hostname.lower().strip("[]")
 
 
-def _is_no_proxy_target(target_url: str | None, settings: Settings) -> bool:
-    """Return whether the target URL should bypass proxies.
+def _fast_hostname(url: str) -> str | None:
+    """Return the lowercase hostname of a URL, like `urlsplit(url).hostname`.
+
+    Plain `scheme://authority` URLs are scanned directly; anything else (no scheme,
+    IPv6 literals, percent escapes, whitespace, non-ASCII authorities) goes through `urlsplit`.
 
     Args:
-        target_url (str | None): Target request URL.
-        settings (Settings): Runtime settings.
+        url (str): URL to inspect.
 
     Returns:
-        bool: True when proxy must be bypassed.
+        str | None: Lowercase hostname, or None when the URL has none.
     """
-    if not target_url:
-        return False
+    match = _URL_AUTHORITY.match(url)
+    if match is None:
+        return urlsplit(url).hostname
+    authority = match.group(1)
+    if not authority.isascii() or not _URL_AUTHORITY_FALLBACK_CHARS.isdisjoint(authority):
+        return urlsplit(url).hostname
+    return authority.rpartition("@")[2].partition(":")[0].lower() or None
 
-    hostname = urlparse(target_url).hostname
-    if not hostname:
-        return False
 
-    host = hostname.lower().strip("[]")
-    regex = settings.no_proxy_regex
-    if regex and regex.fullmatch(host):
+@lru_cache(maxsize=1024)
+def _host_bypasses_proxy(host: str, matcher: _NoProxyMatcher) -> bool:
+    """Return whether a host matches compiled NO_PROXY matchers.
+
+    Decisions are cached per host and matcher object, so repeated requests to the same
+    host skip matching and IP parsing, and matchers of another Settings instance never
+    share entries. Hosts are only parsed as IP addresses when NO_PROXY lists networks.
+
+    Args:
+        host (str): Lowercase hostname without IPv6 brackets.
+        matcher (_NoProxyMatcher): Compiled NO_PROXY matchers.
+
+    Returns:
+        bool: True when proxy must be bypassed.
+    """
+    wildcard = matcher.wildcard
+    if wildcard is _NO_PROXY_MATCH_ALL or host in matcher.hosts or host.endswith(matcher.suffixes):
         return True
+    if wildcard and wildcard.fullmatch(host):
+        return True
+    ranges = matcher.ranges
+    if not (ranges[0][0] or ranges[1][0]):
+        return False
 
     try:
         host_ip = ipaddress.ip_address(host)
     except ValueError:
         return False
-    return any(host_ip in network for network in settings.no_proxy_networks)
+    starts, ends = ranges[isinstance(host_ip, ipaddress.IPv6Address)]
+    value = int(host_ip)
+    index = bisect.bisect_right(starts, value) - 1
+    return index >= 0 and value <= ends[index]
+
+
+def _merge_network_ranges(networks: tuple[NoProxyNetwork, ...]) -> NoProxyRanges:
+    """Convert networks into sorted, disjoint integer ranges per IP version.
+
+    Overlapping and adjacent networks are merged, so a single bisection finds the only
+    range that can contain an address.
+
+    Args:
+        networks (tuple[NoProxyNetwork, ...]): Parsed NO_PROXY networks.
+
+    Returns:
+        NoProxyRanges: IPv4 then IPv6 `(starts, ends)` tuples of inclusive bounds.
+    """
+    merged: tuple[list[list[int]], list[list[int]]] = ([], [])
+    bounds = sorted(
+        (
+            isinstance(network, ipaddress.IPv6Network),
+            int(network.network_address),
+            int(network.broadcast_address),
+        )
+        for network in networks
+    )
+    for is_v6, start, end in bounds:
+        ranges = merged[is_v6]
+        if ranges and start <= ranges[-1][1] + 1:
+            ranges[-1][1] = max(ranges[-1][1], end)
+        else:
+            ranges.append([start, end])
+    v4, v6 = ((tuple(start for start, _ in ranges), tuple(end for _, end in ranges)) for ranges in merged)
+    return v4, v6
+
+
+def build_direct_httpx_client_kwargs(settings: Settings) -> dict[str, Any]:
+    """Build kwargs for HTTPX clients that never use a proxy.
+
+    Args:
+        settings (Settings): Runtime settings.
+
+    Returns:
+        dict[str, Any]: Arguments for client constructors.
+    """
+    return {"verify": settings.ssl_context, "timeout": settings.timeout}
+
+
+def build_proxy_httpx_client_kwargs(settings: Settings) -> dict[str, Any]:
+    """Build kwargs for HTTPX clients routed through the configured proxy, if any.
+
+    Args:
+        settings (Settings): Runtime settings.
+
+    Returns:
+        dict[str, Any]: Arguments for client constructors.
+    """
+    kwargs = build_direct_httpx_client_kwargs(settings)
+    if settings.proxy_url:
+        kwargs["proxy"] = settings.proxy_url
+    return kwargs
 
 
 def build_httpx_client_kwargs(
@@ -522,18 +748,9 @@ def build_httpx_client_kwargs(
     Returns:
         dict[str, Any]: Arguments for client constructors.
     """
-    proxy_url = settings.https_proxy or settings.http_proxy or settings.all_proxy
-
-    kwargs: dict[str, Any] = {
-        "verify": build_ssl_context(settings),
-        "timeout": settings.timeout,
-    }
-
-    should_bypass = force_no_proxy or _is_no_proxy_target(target_url, settings)
-    if proxy_url and not should_bypass:
-        kwargs["proxy"] = proxy_url
-
-    return kwargs
+    if force_no_proxy or settings.should_bypass_proxy(target_url):
+        return build_direct_httpx_client_kwargs(settings)
+    return build_proxy_httpx_client_kwargs(settings)
 
 
 @lru_cache(maxsize=1)
@@ -551,10 +768,15 @@ def get_settings() -> Settings:
     except Exception as exc:
         if _is_missing_settings_error(exc):
             try:
-                ensure_env_file_exists()
-                return Settings()
+                created = ensure_env_file_exists()
             except Exception as retry_exc:
                 raise SettingsError(exc=retry_exc) from retry_exc
+            # Without a freshly created `.env`, a retry would fail the same way.
+            if created:
+                try:
+                    return Settings()
+                except Exception as retry_exc:
+                    raise SettingsError(exc=retry_exc) from retry_exc
         raise SettingsError(exc=exc) from exc
 
 
@@ -562,20 +784,24 @@ def ensure_env_file_exists(
     *,
     env_path: Path = Path(".env"),
     template_path: Path = Path(".env.template"),
-) -> None:
+) -> bool:
     """Create `.env` from template when missing.
 
     Args:
         env_path (Path): Target environment file path.
         template_path (Path): Template file path.
+
+    Returns:
+        bool: True when the environment file was created.
     """
     if env_path.exists() or not template_path.exists():
-        return
+        return False
     env_path.write_text(template_path.read_text(encoding="utf-8"), encoding="utf-8")
     logger.info(
         "Created environment file from template",
         extra={"env_path": str(env_path), "template_path": str(template_path)},
     )
+    return True
 
 
 def _is_missing_settings_error(exc: Exception) -> bool:
@@ -589,7 +815,8 @@ def _is_missing_settings_error(exc: Exception) -> bool:
     """
     if not isinstance(exc, ValidationError):
         return False
-    return any(error.get("type") == "missing" for error in exc.errors())
+    errors = exc.errors(include_url=False, include_context=False, include_input=False)
+    return any(error["type"] == "missing" for error in errors)
 
 
 def _is_local_hostname(hostname: str) -> bool:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from enum import StrEnum
+from typing import cast
 
 
 class _EnumMixin(StrEnum):
@@ -21,6 +22,9 @@ class _EnumMixin(StrEnum):
         Returns:
             _EnumMixin: Parsed enum value.
         """
+        member = cls._value2member_map_.get(value)
+        if member is not None:
+            return cast("_EnumMixin", member)
         try:
             return cls(value)
         except ValueError as exc:
@@ -52,6 +56,13 @@ class ExtractionBackendType(_EnumMixin):
     OCR = "ocr"
 
 
+class FingerprintAlgorithm(_EnumMixin):
+    """Hash algorithms used to fingerprint input documents."""
+
+    SHA256 = "sha256"
+    BLAKE3 = "blake3"
+
+
 class FieldKind(_EnumMixin):
     """Supported schema field kinds."""
 
@@ -1,7 +1,10 @@
 """Extraction request/result and pricing models."""
 
+import stat
+from collections.abc import Iterable
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
@@ -36,12 +39,14 @@ class PricingCall(BaseModel):
     def __add__(self, other: "PricingCall") -> "PricingCall":
         """Combine two PricingCall instances by summing token counts and costs.
 
+        Delegates to ``sum``, so both share one rule for unknown (None) values and raise
+        ``ModelMismatchError`` when provider/model differ.
+
         Args:
             other (PricingCall): Another PricingCall instance to combine with.
 
         Raises:
             NotImplementedError: If the other object is not a PricingCall instance.
-            ModelMismatchError: If provider/model differ.
 
         Returns:
             PricingCall: A new instance with combined values.
@@ -49,22 +54,60 @@ class PricingCall(BaseModel):
         if not isinstance(other, PricingCall):
             raise NotImplementedError("Cannot add PricingCall with non-PricingCall instance")
 
-        if self.provider != other.provider or self.model != other.model:
-            raise ModelMismatchError(self.provider, self.model, other.provider, other.model)
+        return cast("PricingCall", type(self).sum((self, other)))
+
+    @classmethod
+    def sum(cls, calls: Iterable["PricingCall"]) -> "PricingCall | None":
+        """Aggregate pricing calls in one pass, building a single result instance.
+
+        Args:
+            calls (Iterable[PricingCall]): Calls sharing one provider and model.
 
-        return PricingCall(
-            provider=self.provider,
-            model=self.model,
-            input_tokens=_sum_optional_int(self.input_tokens, other.input_tokens),
-            output_tokens=_sum_optional_int(self.output_tokens, other.output_tokens),
-            total_cost_usd=_sum_optional_float(self.total_cost_usd, other.total_cost_usd),
+        Raises:
+            ModelMismatchError: If provider/model differ.
+
+        Returns:
+            PricingCall | None: Aggregated call, or None when ``calls`` is empty.
+        """
+        iterator = iter(calls)
+        first = next(iterator, None)
+        if first is None:
+            return None
+
+        provider, model = first.provider, first.model
+        input_tokens, output_tokens, total_cost_usd = (
+            first.input_tokens,
+            first.output_tokens,
+            first.total_cost_usd,
+        )
+        # None means unknown: a sum stays unknown only when every call leaves it unknown.
+        for call in iterator:
+            if call.provider != provider or call.model != model:
+                raise ModelMismatchError(provider, model, call.provider, call.model)
+            if call.input_tokens is not None:
+                input_tokens = call.input_tokens if input_tokens is None else input_tokens + call.input_tokens
+            if call.output_tokens is not None:
+                output_tokens = (
+                    call.output_tokens if output_tokens is None else output_tokens + call.output_tokens
+                )
+            if call.total_cost_usd is not None:
+                total_cost_usd = (
+                    call.total_cost_usd if total_cost_usd is None else total_cost_usd + call.total_cost_usd
+                )
+
+        return cls.model_construct(
+            provider=provider,
+            model=model,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            total_cost_usd=total_cost_usd,
         )
 
 
 class ExtractionResult(BaseModel):
     """Extraction result persisted to JSON."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", strict=True)
 
     fields: list[FieldValue]
     flat: dict[str, str]
@@ -114,17 +157,19 @@ class ExtractRequest(BaseModel):
         """
         if not isinstance(value, Path):
             raise TypeError("input_path must be a pathlib.Path instance")  # noqa: TRY003
-        if not value.exists():
-            raise ValueError("Input path does not exist")  # noqa: TRY003
-        if not value.is_file():
+        # One stat call answers both checks; is_file() after exists() would stat twice.
+        try:
+            mode = value.stat().st_mode
+        except (OSError, ValueError):
+            raise ValueError("Input path does not exist") from None  # noqa: TRY003
+        if not stat.S_ISREG(mode):
             raise ValueError("Input path is not a file")  # noqa: TRY003
         return value
 
 
-class CollectSchemaValuesInput(BaseModel):
-    """Input payload for schema value collection."""
-
-    model_config = ConfigDict(extra="forbid", arbitrary_types_allowed=True)
+@dataclass(frozen=True, slots=True)
+class CollectSchemaValuesInput:
+    """Input payload for schema value collection, built internally without validation."""
 
     schema_spec: SchemaSpec
     request: ExtractRequest
@@ -132,37 +177,3 @@ class CollectSchemaValuesInput(BaseModel):
     pages: list[RenderedPage]
     use_page_groups: bool
     schema_page_map: dict[int, int] | None
-
-
-def _sum_optional_int(value1: int | None, value2: int | None) -> int | None:
-    """Sum optional int values while preserving unknown state.
-
-    Args:
-        value1 (int | None): Optional int value.
-        value2 (int | None): Optional int value.
-
-    Returns:
-        int | None: Sum when at least one value is known, else None.
-    """
-    if value1 is None:
-        return value2
-    if value2 is None:
-        return value1
-    return value1 + value2
-
-
-def _sum_optional_float(value1: float | None, value2: float | None) -> float | None:
-    """Sum optional float values while preserving unknown state.
-
-    Args:
-        value1 (float | None): Optional float value.
-        value2 (float | None): Optional float value.
-
-    Returns:
-        float | None: Sum when at least one value is known, else None.
-    """
-    if value1 is None:
-        return value2
-    if value2 is None:
-        return value1
-    return value1 + value2
@@ -10,7 +10,7 @@ from pydantic import BaseModel, ConfigDict, Field
 class SanitizedJsonSchema(BaseModel):
     """Schema payload used for strict structured output."""
 
-    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+    model_config = ConfigDict(extra="forbid", populate_by_name=True, frozen=True)
 
     name: str
     json_schema: dict[str, Any] = Field(alias="schema")
@@ -2,17 +2,38 @@
 
 from __future__ import annotations
 
+import base64
+from dataclasses import dataclass
+from typing import Annotated
+
 from pydantic import BaseModel, ConfigDict, Field
 
+# Shared 1-based bound type, so every page bound reuses one constrained int schema.
+OneBasedInt = Annotated[int, Field(ge=1)]
 
-class RenderedPage(BaseModel):
-    """Rendered page sent to extraction backends."""
 
-    model_config = ConfigDict(extra="forbid")
+@dataclass(frozen=True, slots=True)
+class RenderedPage:
+    """Rendered page sent to extraction backends.
+
+    Built internally once per rendered page, so it skips pydantic validation. The image is kept
+    as raw bytes; base64 encoding happens only at the network boundary that needs it.
+    """
 
     page_number: int
     mime_type: str
-    data_base64: str
+    data: bytes
+
+    @property
+    def data_base64(self) -> str:
+        """Return the image bytes as base64 text.
+
+        Encodes on every access; backends sending a page more than once keep the result.
+
+        Returns:
+            str: Base64-encoded image payload.
+        """
+        return base64.b64encode(self.data).decode("ascii")
 
 
 class PageSelectionRequest(BaseModel):
@@ -21,18 +42,17 @@ class PageSelectionRequest(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
     pdf_path: str
-    page_start: int | None = Field(default=None, ge=1)
-    page_end: int | None = Field(default=None, ge=1)
-    max_pages: int | None = Field(default=None, ge=1)
+    page_start: OneBasedInt | None = None
+    page_end: OneBasedInt | None = None
+    max_pages: OneBasedInt | None = None
     ink_ratio_threshold: float = Field(ge=0.0)
     near_white_level: int = Field(ge=0, le=255)
     sample_dpi: int = Field(default=72, ge=36, le=300)
 
 
-class PageSelectionAnalysis(BaseModel):
+@dataclass(frozen=True, slots=True)
+class PageSelectionAnalysis:
     """Page analysis for a selected PDF range."""
 
-    model_config = ConfigDict(extra="forbid", frozen=True)
-
-    selected_page_numbers: list[int]
-    nonblank_page_numbers: list[int]
+    selected_page_numbers: tuple[int, ...]
+    nonblank_page_numbers: tuple[int, ...]
@@ -2,37 +2,73 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict, Field
+import sys
+from functools import lru_cache
+from typing import Annotated
+
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
 
 from extractforms.typing.enums import FieldKind, FieldSemanticType
 
+# Field keys repeat across every document extracted with one schema; interning them at load
+# time lets results share one string object per key.
+InternedKey = Annotated[str, AfterValidator(sys.intern)]
+
+
+@lru_cache(maxsize=1024)
+def _shared_options(options: tuple[str, ...]) -> tuple[str, ...]:
+    """Return the first-seen tuple equal to ``options``.
+
+    Args:
+        options (tuple[str, ...]): Field options.
+
+    Returns:
+        tuple[str, ...]: Shared options tuple.
+    """
+    return options
+
+
+# Option sets such as yes/no repeat across fields and schemas; equal sets share one tuple.
+SharedOptions = Annotated[tuple[str, ...], AfterValidator(_shared_options)]
+
 
 class SchemaField(BaseModel):
     """Single schema field definition."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
-    key: str
+    key: InternedKey
     label: str
     page: int | None = None
     kind: FieldKind = FieldKind.UNKNOWN
     semantic_type: FieldSemanticType | None = None
     expected_type: str | None = None
     regex: str | None = None
-    options: list[str] = Field(default_factory=list)
+    options: SharedOptions = Field(default_factory=tuple)
 
 
 class SchemaSpec(BaseModel):
     """Schema describing an input form."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     id: str
     name: str
     fingerprint: str
     version: int = 1
     schema_family_id: str | None = None
-    fields: list[SchemaField]
+    fields: tuple[SchemaField, ...]
+
+    def __hash__(self) -> int:
+        """Hash the schema identity so it can key ``functools`` caches.
+
+        Equal schemas share identity fields, so hashing those alone stays consistent with
+        equality without walking every field.
+
+        Returns:
+            int: Hash of the schema identity.
+        """
+        return hash((self.id, self.name, self.fingerprint, self.version, self.schema_family_id))
 
 
 class MatchResult(BaseModel):
@@ -1,11 +1,54 @@
-"""Pytest marker auto-assignment by folder."""
+"""Shared test fixtures and pytest marker auto-assignment by folder."""
 
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import pytest
 from extractforms import logger
+from extractforms.settings import Settings
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+@pytest.fixture(scope="session")
+def stub_pdf(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write one read-only stub PDF shared by every test that only needs an existing input path.
+
+    Returns:
+        Path: Path to the shared ``doc.pdf`` stub.
+    """
+    pdf = tmp_path_factory.mktemp("pdfs") / "doc.pdf"
+    pdf.write_bytes(b"doc")
+    return pdf
+
+
+# Every field is passed explicitly (with its declared default), so neither the developer's
+# environment nor a local `.env` leaks into tests.
+_BASE_SETTINGS_FIELDS: dict[str, Any] = {
+    str(field.validation_alias or name): field.get_default(call_default_factory=True)
+    for name, field in Settings.model_fields.items()
+}
+
+
+@pytest.fixture(scope="session")
+def make_settings() -> Callable[..., Settings]:
+    """Return a factory building validated settings from explicit fields.
+
+    Overrides are keyed by field name. Every call validates a fresh instance, so field
+    validators run and runtime state (HTTP clients, proxy caches) is never shared between tests.
+    """
+
+    def _make(**overrides: Any) -> Settings:  # noqa: ANN401
+        fields = {
+            str(Settings.model_fields[name].validation_alias or name): value
+            for name, value in overrides.items()
+        }
+        return Settings(_env_file=None, **{**_BASE_SETTINGS_FIELDS, **fields})
+
+    return _make
 
 
 def _mark_tests_by_directory(
@@ -2,10 +2,18 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from extractforms import extractor
 from extractforms.extractor import run_extract
 from extractforms.settings import Settings
 from extractforms.typing.enums import ConfidenceLevel, FieldKind, FieldSemanticType, PassMode
-from extractforms.typing.models import ExtractRequest, FieldValue, RenderedPage, SchemaField, SchemaSpec
+from extractforms.typing.models import (
+    ExtractRequest,
+    FieldValue,
+    PageSelectionAnalysis,
+    RenderedPage,
+    SchemaField,
+    SchemaSpec,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -13,10 +21,10 @@ if TYPE_CHECKING:
 
 def test_typed_fields_extraction_flow_applies_normalization_and_null_sentinel(
     monkeypatch,
+    stub_pdf: Path,
     tmp_path: Path,
 ) -> None:
-    pdf = tmp_path / "doc.pdf"
-    pdf.write_bytes(b"doc")
+    pdf = stub_pdf
     schema_path = tmp_path / "schema.schema.json"
 
     schema = SchemaSpec(
@@ -73,16 +81,16 @@ def test_typed_fields_extraction_flow_applies_normalization_and_null_sentinel(
                 FieldValue(key="amount", value="1 234,50", page=1, confidence=ConfidenceLevel.HIGH),
             ], None
 
-    page = RenderedPage(page_number=1, mime_type="image/png", data_base64="AA==")
-    monkeypatch.setattr("extractforms.extractor.render_pdf_pages", lambda *args, **kwargs: [page])
-    monkeypatch.setattr("extractforms.extractor.MultimodalLLMBackend", _FakeBackend)
+    page = RenderedPage(page_number=1, mime_type="image/png", data=b"\x00")
+    monkeypatch.setattr(extractor, "render_pdf_pages", lambda *args, **kwargs: [page])
+    monkeypatch.setattr(extractor, "MultimodalLLMBackend", _FakeBackend)
     monkeypatch.setattr(
-        "extractforms.extractor.analyze_page_selection",
-        lambda *args, **kwargs: type(
-            "Analysis",
-            (),
-            {"selected_page_numbers": [1], "nonblank_page_numbers": [1]},
-        )(),
+        extractor,
+        "analyze_page_selection",
+        lambda *args, **kwargs: PageSelectionAnalysis(
+            selected_page_numbers=(1,),
+            nonblank_page_numbers=(1,),
+        ),
     )
 
     request = ExtractRequest(
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from extractforms import extractor
 from extractforms.extractor import extract_values
 from extractforms.settings import Settings
 from extractforms.typing.enums import ConfidenceLevel, PassMode
 from extractforms.typing.models import (
+    PageSelectionAnalysis,
     ExtractRequest,
     FieldValue,
     RenderedPage,
@@ -17,16 +19,17 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 
-def _rendered_page(page_number: int) -> RenderedPage:
-    return RenderedPage(page_number=page_number, mime_type="image/png", data_base64="AA==")
+_PAGES = tuple(
+    RenderedPage(page_number=number, mime_type="image/png", data=b"\x00") for number in range(1, 5)
+)
 
 
 def test_extract_values_routes_schema_pages_with_interleaved_blank_pages(
     monkeypatch,
+    stub_pdf: Path,
     tmp_path: Path,
 ) -> None:
-    pdf = tmp_path / "doc.pdf"
-    pdf.write_bytes(b"doc")
+    pdf = stub_pdf
 
     schema = SchemaSpec(
         id="id",
@@ -57,22 +60,15 @@ def test_extract_values_routes_schema_pages_with_interleaved_blank_pages(
             return [], None
 
     calls: list[tuple[tuple[int, ...], tuple[str, ...]]] = []
-    page1 = _rendered_page(1)
-    page2 = _rendered_page(2)
-    page3 = _rendered_page(3)
-    page4 = _rendered_page(4)
-    monkeypatch.setattr(
-        "extractforms.extractor.render_pdf_pages",
-        lambda *args, **kwargs: [page1, page2, page3, page4],
-    )
-    monkeypatch.setattr("extractforms.extractor.MultimodalLLMBackend", _FakeBackend)
+    monkeypatch.setattr(extractor, "render_pdf_pages", lambda *args, **kwargs: list(_PAGES))
+    monkeypatch.setattr(extractor, "MultimodalLLMBackend", _FakeBackend)
     monkeypatch.setattr(
-        "extractforms.extractor.analyze_page_selection",
-        lambda *args, **kwargs: type(
-            "Analysis",
-            (),
-            {"selected_page_numbers": [1, 2, 3, 4], "nonblank_page_numbers": [1, 3]},
-        )(),
+        extractor,
+        "analyze_page_selection",
+        lambda *args, **kwargs: PageSelectionAnalysis(
+            selected_page_numbers=(1, 2, 3, 4),
+            nonblank_page_numbers=(1, 3),
+        ),
     )
 
     request = ExtractRequest(
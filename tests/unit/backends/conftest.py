@@ -0,0 +1,13 @@
+"""Shared fixtures for backend unit tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from extractforms.typing.models import RenderedPage
+
+
+@pytest.fixture(scope="module")
+def rendered_page() -> RenderedPage:
+    """Return one immutable rendered page shared by a test module."""
+    return RenderedPage(page_number=1, mime_type="image/png", data=b"\x00")
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 
 from extractforms.backends import multimodal_openai
@@ -8,13 +10,11 @@ from extractforms.exceptions import BackendError
 from extractforms.settings import Settings
 from extractforms.typing.models import RenderedPage
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-def _settings(*, base_url: str | None, api_key: str | None, model: str = "gpt-4o-mini") -> Settings:
-    settings = Settings()
-    settings.openai_base_url = base_url
-    settings.openai_api_key = api_key
-    settings.openai_model = model
-    return settings
+_SCHEMA_JSON = '{"name":"demo","fields":[]}'
+_VALUES_JSON = '{"fields":[{"key":"a","value":"v","page":1,"confidence":"high"}]}'
 
 
 class _FakeClient:
@@ -26,7 +26,7 @@ class _FakeCompletion:
         assert mode == "json"
         return {
             "usage": {"prompt_tokens": 10, "completion_tokens": 3},
-            "choices": [{"message": {"content": '{"name":"demo","fields":[]}'}}],
+            "choices": [{"message": {"content": _SCHEMA_JSON}}],
         }
 
 
@@ -52,28 +52,42 @@ class _FakeOpenAI:
         return _FakeOpenAIClient()
 
 
-def test_post_chat_completions_requires_base_url_and_key() -> None:
-    backend = MultimodalLLMBackend(_settings(base_url=None, api_key=None))
-    with pytest.raises(BackendError, match="OPENAI_BASE_URL"):
-        backend._post_chat_completions({})
-
-
-def test_post_chat_completions_success(monkeypatch) -> None:
-    backend = MultimodalLLMBackend(
-        _settings(
-            base_url="https://llm.local/v1",
-            api_key="test-api-key",  # pragma: allowlist secret
-            model="x",
-        ),
-    )
+@pytest.fixture(autouse=True)
+def _stub_openai_transport(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
         Settings,
         "select_async_httpx_client",
         lambda _self, _target_url: _FakeClient(),
     )
-
     monkeypatch.setattr(multimodal_openai, "AsyncOpenAI", _FakeOpenAI)
 
+
+@pytest.mark.parametrize(
+    ("base_url", "api_key", "match"),
+    [
+        (None, None, "OPENAI_BASE_URL"),
+        ("https://llm.local/v1", "", "OPENAI_API_KEY"),
+    ],
+)
+def test_post_chat_completions_requires_endpoint_config(
+    base_url: str | None,
+    api_key: str | None,
+    match: str,
+    make_settings: Callable[..., Settings],
+) -> None:
+    backend = MultimodalLLMBackend(make_settings(openai_base_url=base_url, openai_api_key=api_key))
+    with pytest.raises(BackendError, match=match):
+        backend._post_chat_completions({})
+
+
+def test_post_chat_completions_success(make_settings: Callable[..., Settings]) -> None:
+    backend = MultimodalLLMBackend(
+        make_settings(
+            openai_base_url="https://llm.local/v1",
+            openai_api_key="test-api-key",  # pragma: allowlist secret
+            openai_model="x",
+        ),
+    )
     payload, pricing = backend._post_chat_completions({"model": "x"})
 
     assert payload["usage"]["prompt_tokens"] == 10
@@ -81,70 +95,70 @@ def test_post_chat_completions_success(monkeypatch) -> None:
     assert pricing.model == "x"
 
 
-def test_infer_schema_and_extract_values_with_mocked_post(mocker) -> None:
+def test_infer_schema_and_extract_values_with_mocked_post(
+    mocker,
+    rendered_page: RenderedPage,
+    make_settings: Callable[..., Settings],
+) -> None:
     backend = MultimodalLLMBackend(
-        _settings(
-            base_url="https://llm.local/v1",
-            api_key="test-api-key",  # pragma: allowlist secret
+        make_settings(
+            openai_base_url="https://llm.local/v1",
+            openai_api_key="test-api-key",  # pragma: allowlist secret
         ),
     )
-    page = RenderedPage(page_number=1, mime_type="image/png", data_base64="AA==")
-
     mocker.patch.object(
         backend,
         "_apost_chat_completions",
         new=mocker.AsyncMock(
             side_effect=[
-                (
-                    {"choices": [{"message": {"content": '{"name":"demo","fields":[]}'}}]},
-                    None,
-                ),
-                (
-                    {
-                        "choices": [
-                            {
-                                "message": {
-                                    "content": '{"fields":[{"key":"a","value":"v","page":1,"confidence":"high"}]}',
-                                },
-                            },
-                        ],
-                    },
-                    None,
-                ),
+                ({"choices": [{"message": {"content": _SCHEMA_JSON}}]}, None),
+                ({"choices": [{"message": {"content": _VALUES_JSON}}]}, None),
             ],
         ),
     )
 
-    schema, _ = backend.infer_schema([page])
-    values, _ = backend.extract_values([page], ["a"])
+    schema, _ = backend.infer_schema([rendered_page])
+    values, _ = backend.extract_values([rendered_page], ["a"])
 
     assert schema.name == "demo"
     assert values[0].key == "a"
 
 
-def test_post_chat_completions_requires_api_key() -> None:
-    backend = MultimodalLLMBackend(_settings(base_url="https://llm.local/v1", api_key=""))
-    with pytest.raises(BackendError, match="OPENAI_API_KEY"):
-        backend._post_chat_completions({})
+def test_image_content_builder(rendered_page: RenderedPage, make_settings: Callable[..., Settings]) -> None:
+    content = MultimodalLLMBackend(make_settings())._image_content(rendered_page)
+    assert content["image_url"]["url"].startswith("data:image/png;base64,")
 
 
-def test_image_content_builder() -> None:
-    page = RenderedPage(page_number=1, mime_type="image/png", data_base64="AA==")
-    content = MultimodalLLMBackend._image_content(page)
-    assert content["image_url"]["url"].startswith("data:image/png;base64,")
+def test_image_content_encodes_each_page_once(monkeypatch, make_settings: Callable[..., Settings]) -> None:
+    encoded: list[int] = []
+    original = RenderedPage.data_base64
+
+    def _counting_data_base64(page: RenderedPage) -> str:
+        encoded.append(page.page_number)
+        return original.fget(page)
+
+    monkeypatch.setattr(RenderedPage, "data_base64", property(_counting_data_base64))
+    backend = MultimodalLLMBackend(make_settings())
+    pages = [RenderedPage(page_number=number, mime_type="image/png", data=b"\x00") for number in (1, 2)]
+
+    first = backend._build_pages_payload("a", pages, "values_response", multimodal_openai._ValuesResponse)
+    second = backend._build_pages_payload("b", pages, "values_response", multimodal_openai._ValuesResponse)
+
+    assert encoded == [1, 2]
+    assert first["messages"][0]["content"][2] == second["messages"][0]["content"][2]
 
 
-def test_payload_includes_page_markers(mocker) -> None:
+def test_payload_includes_page_markers(mocker, make_settings: Callable[..., Settings]) -> None:
     backend = MultimodalLLMBackend(
-        _settings(
-            base_url="https://llm.local/v1",
-            api_key="test-api-key",  # pragma: allowlist secret
+        make_settings(
+            openai_base_url="https://llm.local/v1",
+            openai_api_key="test-api-key",  # pragma: allowlist secret
         ),
     )
-    page = RenderedPage(page_number=2, mime_type="image/png", data_base64="AA==")
+    page = RenderedPage(page_number=2, mime_type="image/png", data=b"\x00")
 
     mock_call = mocker.AsyncMock(
-        return_value=({"choices": [{"message": {"content": '{"name":"demo","fields":[]}'}}]}, None),
+        return_value=({"choices": [{"message": {"content": _SCHEMA_JSON}}]}, None),
     )
     mocker.patch.object(backend, "_apost_chat_completions", new=mock_call)
 
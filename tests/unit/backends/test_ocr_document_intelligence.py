@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 
 from extractforms.backends.ocr_document_intelligence import OCRBackend
@@ -7,6 +9,9 @@ from extractforms.exceptions import BackendError
 from extractforms.typing.enums import ConfidenceLevel
 from extractforms.typing.models import PricingCall, RenderedPage
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 class _FakeOCRProvider:
     def extract_pages(self, pages: list[RenderedPage]) -> list[dict[str, object]]:
@@ -24,36 +29,49 @@ class _FakeOCRProvider:
         ]
 
 
-def test_ocr_backend_requires_provider() -> None:
-    backend = OCRBackend()
-    page = RenderedPage(page_number=1, mime_type="image/png", data_base64="AA==")
-    with pytest.raises(BackendError, match="requires an OCR provider bridge"):
-        backend.infer_schema([page])
+@pytest.fixture(scope="module")
+def ocr_backend() -> OCRBackend:
+    return OCRBackend(provider=_FakeOCRProvider())
 
 
-def test_ocr_backend_rejects_empty_pages_for_infer_schema() -> None:
-    backend = OCRBackend(provider=_FakeOCRProvider())
-
+def test_ocr_backend_requires_provider(rendered_page: RenderedPage) -> None:
+    backend = OCRBackend()
+    with pytest.raises(BackendError, match="requires an OCR provider bridge"):
+        backend.infer_schema([rendered_page])
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda backend: backend.infer_schema([]),
+        lambda backend: backend.extract_values([], ["address"]),
+    ],
+    ids=["infer_schema", "extract_values"],
+)
+def test_ocr_backend_rejects_empty_pages(
+    ocr_backend: OCRBackend,
+    call: Callable[[OCRBackend], object],
+) -> None:
     with pytest.raises(BackendError, match="requires at least one rendered page"):
-        backend.infer_schema([])
+        call(ocr_backend)
 
 
-def test_ocr_backend_infer_schema_from_ocr_lines() -> None:
-    backend = OCRBackend(provider=_FakeOCRProvider())
-    page = RenderedPage(page_number=1, mime_type="image/png", data_base64="AA==")
-
-    schema, pricing = backend.infer_schema([page])
+def test_ocr_backend_infer_schema_from_ocr_lines(
+    ocr_backend: OCRBackend,
+    rendered_page: RenderedPage,
+) -> None:
+    schema, pricing = ocr_backend.infer_schema([rendered_page])
 
     assert pricing is None
     assert [field.key for field in schema.fields] == ["phone", "address", "amount", "comment"]
     assert [field.page for field in schema.fields] == [1, 1, 1, 2]
 
 
-def test_ocr_backend_extract_values_from_requested_keys() -> None:
-    backend = OCRBackend(provider=_FakeOCRProvider())
-    page = RenderedPage(page_number=1, mime_type="image/png", data_base64="AA==")
-
-    values, pricing = backend.extract_values([page], ["address", "amount"])
+def test_ocr_backend_extract_values_from_requested_keys(
+    ocr_backend: OCRBackend,
+    rendered_page: RenderedPage,
+) -> None:
+    values, pricing = ocr_backend.extract_values([rendered_page], ["address", "amount"])
 
     assert pricing is None
     assert [(value.key, value.value, value.page, value.confidence) for value in values] == [
@@ -62,14 +80,7 @@ def test_ocr_backend_extract_values_from_requested_keys() -> None:
     ]
 
 
-def test_ocr_backend_rejects_empty_pages_for_extract_values() -> None:
-    backend = OCRBackend(provider=_FakeOCRProvider())
-
-    with pytest.raises(BackendError, match="requires at least one rendered page"):
-        backend.extract_values([], ["address"])
-
-
-def test_ocr_backend_extract_values_handles_malformed_and_empty_lines() -> None:
+def test_ocr_backend_extract_values_handles_malformed_and_empty_lines(rendered_page: RenderedPage) -> None:
     class _MalformedProvider:
         def extract_pages(self, pages: list[RenderedPage]) -> list[dict[str, object]]:
             _ = pages
@@ -79,14 +90,13 @@ def test_ocr_backend_extract_values_handles_malformed_and_empty_lines() -> None:
             ]
 
     backend = OCRBackend(provider=_MalformedProvider())
-    page = RenderedPage(page_number=1, mime_type="image/png", data_base64="AA==")
-    values, pricing = backend.extract_values([page], ["email", "address"])
+    values, pricing = backend.extract_values([rendered_page], ["email", "address"])
 
     assert pricing is None
     assert [(value.key, value.value, value.page) for value in values] == [("email", "NULL", 2)]
 
 
-def test_ocr_backend_prefers_first_duplicate_key_across_pages() -> None:
+def test_ocr_backend_prefers_first_duplicate_key_across_pages(rendered_page: RenderedPage) -> None:
     class _DuplicateProvider:
         def extract_pages(self, pages: list[RenderedPage]) -> list[dict[str, object]]:
             _ = pages
@@ -96,23 +106,22 @@ def test_ocr_backend_prefers_first_duplicate_key_across_pages() -> None:
             ]
 
     backend = OCRBackend(provider=_DuplicateProvider())
-    page = RenderedPage(page_number=1, mime_type="image/png", data_base64="AA==")
-    values, _ = backend.extract_values([page], ["address"])
+    values, _ = backend.extract_values([rendered_page], ["address"])
 
     assert [(value.key, value.value, value.page) for value in values] == [("address", "First value", 1)]
 
 
-def test_ocr_backend_returns_empty_when_requested_keys_not_found() -> None:
-    backend = OCRBackend(provider=_FakeOCRProvider())
-    page = RenderedPage(page_number=1, mime_type="image/png", data_base64="AA==")
-
-    values, pricing = backend.extract_values([page], ["iban"])
+def test_ocr_backend_returns_empty_when_requested_keys_not_found(
+    ocr_backend: OCRBackend,
+    rendered_page: RenderedPage,
+) -> None:
+    values, pricing = ocr_backend.extract_values([rendered_page], ["iban"])
 
     assert pricing is None
     assert values == []
 
 
-def test_ocr_backend_applies_optional_text_normalizer() -> None:
+def test_ocr_backend_applies_optional_text_normalizer(rendered_page: RenderedPage) -> None:
     class _Normalizer:
         def normalize_values(self, values: dict[str, str], *, extra_instructions: str | None = None):
             _ = extra_instructions
@@ -125,8 +134,7 @@ def test_ocr_backend_applies_optional_text_normalizer() -> None:
             )
 
     backend = OCRBackend(provider=_FakeOCRProvider(), text_normalizer=_Normalizer())
-    page = RenderedPage(page_number=1, mime_type="image/png", data_base64="AA==")
-    values, pricing = backend.extract_values([page], ["address"])
+    values, pricing = backend.extract_values([rendered_page], ["address"])
 
     assert pricing is not None
     assert values[0].value == "Normalized Address"
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
 import asyncio
+from typing import TYPE_CHECKING
 
 from extractforms.backends.ocr_text_normalizer import OCRTextLLMNormalizer
-from extractforms.settings import Settings
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-def test_normalize_values_falls_back_on_missing_choices(monkeypatch) -> None:
-    settings = Settings()
-    settings.openai_base_url = "https://llm.local/v1"
-    settings.openai_api_key = "test-api-key"  # pragma: allowlist secret
+    from extractforms.settings import Settings
+
+
+def test_normalize_values_falls_back_on_missing_choices(
+    monkeypatch,
+    make_settings: Callable[..., Settings],
+) -> None:
+    settings = make_settings(
+        openai_base_url="https://llm.local/v1",
+        openai_api_key="test-api-key",  # pragma: allowlist secret
+    )
     normalizer = OCRTextLLMNormalizer(settings)
 
     async def _fake_call_completion(payload):
@@ -24,10 +33,14 @@ def test_normalize_values_falls_back_on_missing_choices(monkeypatch) -> None:
     assert pricing is not None
 
 
-def test_normalize_values_falls_back_on_invalid_json(monkeypatch) -> None:
-    settings = Settings()
-    settings.openai_base_url = "https://llm.local/v1"
-    settings.openai_api_key = "test-api-key"  # pragma: allowlist secret
+def test_normalize_values_falls_back_on_invalid_json(
+    monkeypatch,
+    make_settings: Callable[..., Settings],
+) -> None:
+    settings = make_settings(
+        openai_base_url="https://llm.local/v1",
+        openai_api_key="test-api-key",  # pragma: allowlist secret
+    )
     normalizer = OCRTextLLMNormalizer(settings)
 
     async def _fake_call_completion(payload):
@@ -1,85 +1,96 @@
 from __future__ import annotations
 
+import pytest
+
 from extractforms.processing.normalization import normalize_typed_value
 from extractforms.typing.enums import FieldKind, FieldSemanticType
 from extractforms.typing.models import SchemaField
 
 
-def test_normalize_phone_value() -> None:
-    schema_field = SchemaField(
-        key="phone",
-        label="Phone",
-        kind=FieldKind.PHONE,
-        semantic_type=FieldSemanticType.PHONE,
-    )
-
-    normalized = normalize_typed_value(
-        value="00 33 6 12 34 56 78",
+@pytest.mark.parametrize(
+    ("kind", "semantic_type", "value", "expected"),
+    [
+        pytest.param(
+            FieldKind.PHONE,
+            FieldSemanticType.PHONE,
+            "00 33 6 12 34 56 78",
+            "+33612345678",
+            id="phone",
+        ),
+        pytest.param(FieldKind.AMOUNT, FieldSemanticType.AMOUNT, "1 234,50", "1234.5", id="amount"),
+        pytest.param(
+            FieldKind.ADDRESS,
+            FieldSemanticType.ADDRESS,
+            " 10   rue   de la Paix ",
+            "10 rue de la Paix",
+            id="address",
+        ),
+        pytest.param(
+            FieldKind.EMAIL,
+            FieldSemanticType.EMAIL,
+            "John.DOE@Example.org",
+            "john.doe@example.org",
+            id="email",
+        ),
+        pytest.param(FieldKind.UNKNOWN, FieldSemanticType.PERCENTAGE, "12,5 %", "12.5%", id="percentage"),
+    ],
+)
+def test_normalize_typed_value_by_type(
+    kind: FieldKind,
+    semantic_type: FieldSemanticType,
+    value: str,
+    expected: str,
+) -> None:
+    schema_field = SchemaField(key="k", label="L", kind=kind, semantic_type=semantic_type)
+
+    normalized = normalize_typed_value(value=value, schema_field=schema_field, null_sentinel="NULL")
+
+    assert normalized == expected
+
+
+def test_normalize_phone_value_handles_ascii_and_non_ascii_digits() -> None:
+    schema_field = SchemaField(key="phone", label="Phone", kind=FieldKind.PHONE)
+
+    ascii_value = normalize_typed_value(
+        value="+33 (0)6-12.34",
         schema_field=schema_field,
         null_sentinel="NULL",
     )
-
-    assert normalized == "+33612345678"
-
-
-def test_normalize_amount_value() -> None:
-    schema_field = SchemaField(
-        key="amount",
-        label="Amount",
-        kind=FieldKind.AMOUNT,
-        semantic_type=FieldSemanticType.AMOUNT,
-    )
-
-    normalized = normalize_typed_value(value="1 234,50", schema_field=schema_field, null_sentinel="NULL")
-
-    assert normalized == "1234.5"
-
-
-def test_normalize_address_value() -> None:
-    schema_field = SchemaField(
-        key="address",
-        label="Address",
-        kind=FieldKind.ADDRESS,
-        semantic_type=FieldSemanticType.ADDRESS,
-    )
-
-    normalized = normalize_typed_value(
-        value=" 10   rue   de la Paix ",
+    non_ascii_value = normalize_typed_value(
+        value="+\u0663\u0663\u00a06 12",
         schema_field=schema_field,
         null_sentinel="NULL",
     )
 
-    assert normalized == "10 rue de la Paix"
+    assert ascii_value == "+33061234"
+    assert non_ascii_value == "+\u0663\u0663612"
 
 
-def test_normalize_email_value() -> None:
-    schema_field = SchemaField(
-        key="email",
-        label="Email",
-        kind=FieldKind.EMAIL,
-        semantic_type=FieldSemanticType.EMAIL,
-    )
+def test_normalize_amount_value_matches_decimal_formatting() -> None:
+    schema_field = SchemaField(key="amount", label="Amount", kind=FieldKind.AMOUNT)
 
-    normalized = normalize_typed_value(
-        value="John.DOE@Example.org",
-        schema_field=schema_field,
-        null_sentinel="NULL",
-    )
+    def _normalize(value: str) -> str:
+        return normalize_typed_value(value=value, schema_field=schema_field, null_sentinel="NULL")
 
-    assert normalized == "john.doe@example.org"
+    assert _normalize("100,00") == "100"
+    assert _normalize("-0,50") == "-0.5"
+    assert _normalize("0.00001") == "0.00001"
+    assert _normalize("1234567890123456.70") == "1234567890123456.7"
+    assert _normalize("1e3") == "1000"
+    assert _normalize("n/a") == "n/a"
 
 
-def test_normalize_percentage_value() -> None:
+def test_normalize_typed_value_keeps_rule_precedence_for_mixed_typing() -> None:
     schema_field = SchemaField(
-        key="rate",
-        label="Rate",
-        semantic_type=FieldSemanticType.PERCENTAGE,
+        key="contact",
+        label="Contact",
+        kind=FieldKind.PHONE,
+        semantic_type=FieldSemanticType.EMAIL,
     )
+    untyped_field = SchemaField(key="note", label="Note", kind=FieldKind.TEXT)
 
-    normalized = normalize_typed_value(
-        value="12,5 %",
-        schema_field=schema_field,
-        null_sentinel="NULL",
-    )
+    normalized = normalize_typed_value(value="+33 6 12", schema_field=schema_field, null_sentinel="NULL")
+    untouched = normalize_typed_value(value=" Keep  As Is ", schema_field=untyped_field, null_sentinel="NULL")
 
-    assert normalized == "12.5%"
+    assert normalized == "+33612"
+    assert untouched == "Keep  As Is"
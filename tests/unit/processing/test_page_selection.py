@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Self
+from typing import Self
 
 from extractforms.processing.page_selection import (
     analyze_page_selection,
@@ -15,18 +15,13 @@ from extractforms.typing.models import (
     SchemaSpec,
 )
 
-if TYPE_CHECKING:
-    from pathlib import Path
+_PAGES = tuple(
+    RenderedPage(page_number=number, mime_type="image/png", data=b"\x00") for number in range(1, 4)
+)
 
 
 def test_filter_rendered_pages_to_nonblank() -> None:
-    pages = [
-        RenderedPage(page_number=1, mime_type="image/png", data_base64="AA=="),
-        RenderedPage(page_number=2, mime_type="image/png", data_base64="AA=="),
-        RenderedPage(page_number=3, mime_type="image/png", data_base64="AA=="),
-    ]
-
-    filtered = filter_rendered_pages_to_nonblank(pages, nonblank_page_numbers=[1, 3])
+    filtered = filter_rendered_pages_to_nonblank(list(_PAGES), nonblank_page_numbers=[1, 3])
 
     assert [page.page_number for page in filtered] == [1, 3]
 
@@ -41,7 +36,7 @@ def test_build_schema_page_mapping_uses_nonblank_when_blank_pages_are_present()
             SchemaField(key="b", label="B", page=2),
         ],
     )
-    analysis = PageSelectionAnalysis(selected_page_numbers=[1, 2, 3, 4], nonblank_page_numbers=[1, 3])
+    analysis = PageSelectionAnalysis(selected_page_numbers=(1, 2, 3, 4), nonblank_page_numbers=(1, 3))
 
     mapping = build_schema_page_mapping(schema=schema, analysis=analysis)
 
@@ -61,13 +56,7 @@ def test_build_schema_page_mapping_defaults_to_identity_without_analysis() -> No
     assert mapping == {1: 1, 2: 2}
 
 
-def test_analyze_page_selection_detects_nonblank_pages(  # noqa: C901
-    monkeypatch,
-    tmp_path: Path,
-) -> None:
-    pdf = tmp_path / "doc.pdf"
-    pdf.write_bytes(b"pdf")
-
+def test_analyze_page_selection_detects_nonblank_pages(monkeypatch) -> None:  # noqa: C901
     class _FakePixmap:
         def __init__(self, samples: bytes) -> None:
             self.width = 1
@@ -103,7 +92,7 @@ def test_analyze_page_selection_detects_nonblank_pages(  # noqa: C901
                 _ = (x, y)
 
         @staticmethod
-        def open(path: Path) -> _FakeDoc:
+        def open(path: str) -> _FakeDoc:
             _ = path
             return _FakeDoc()
 
@@ -111,7 +100,7 @@ def test_analyze_page_selection_detects_nonblank_pages(  # noqa: C901
 
     analysis = analyze_page_selection(
         PageSelectionRequest(
-            pdf_path=pdf.as_posix(),
+            pdf_path="unused.pdf",
             page_start=1,
             page_end=2,
             max_pages=None,
@@ -121,5 +110,5 @@ def test_analyze_page_selection_detects_nonblank_pages(  # noqa: C901
     )
 
     assert analysis is not None
-    assert analysis.selected_page_numbers == [1, 2]
-    assert analysis.nonblank_page_numbers == [1]
+    assert analysis.selected_page_numbers == (1, 2)
+    assert analysis.nonblank_page_numbers == (1,)
@@ -2,9 +2,16 @@ from __future__ import annotations
 
 import asyncio
 
+import pytest
+
 from extractforms.async_runner import run_async
 
 
+@pytest.fixture(scope="module")
+def anyio_backend() -> str:
+    return "asyncio"
+
+
 async def _identity(value: int) -> int:
     await asyncio.sleep(0)
     return value
@@ -14,9 +21,8 @@ def test_run_async_from_sync_context() -> None:
     assert run_async(_identity(7)) == 7
 
 
-def test_run_async_with_running_loop() -> None:
-    async def _nested() -> int:
-        await asyncio.sleep(0)
-        return run_async(_identity(11))
+@pytest.mark.anyio
+async def test_run_async_with_running_loop() -> None:
+    await asyncio.sleep(0)
 
-    assert asyncio.run(_nested()) == 11
+    assert run_async(_identity(11)) == 11
@@ -68,10 +68,9 @@ def test_extract_request_supports_backend_override() -> None:
     assert request.backend == ExtractionBackendType.OCR
 
 
-def test_main_runs_extract_flow(mocker, tmp_path: Path) -> None:
+def test_main_runs_extract_flow(mocker, stub_pdf: Path, tmp_path: Path) -> None:
     output_path = tmp_path / "result.json"
-    input_pdf = tmp_path / "input.pdf"
-    input_pdf.write_bytes(b"pdf")
+    input_pdf = stub_pdf
 
     parser = mocker.Mock()
     parser.parse_args.return_value = Namespace(
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, cast
+import re
+from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple, cast
 
 import pytest
 from extractforms import extractor
@@ -19,297 +23,338 @@ from extractforms.extractor import (
     result_to_json_dict,
     run_extract,
 )
-from extractforms.settings import Settings
 from extractforms.typing.models import (
-    ExtractRequest,
     ExtractionResult,
+    ExtractRequest,
     FieldValue,
+    MatchResult,
+    PageSelectionAnalysis,
     RenderedPage,
     SchemaField,
     SchemaSpec,
 )
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Callable, Sequence
+
+    from extractforms.settings import Settings
+
+    _Responder = Callable[[Sequence[RenderedPage], list[str], str | None], tuple[list[FieldValue], None]]
+
 
+_REQUIRES_SCHEMA_ID = re.compile(r"requires --schema-id")
+_OCR_FACTORY_FAILED = re.compile(r"OCR provider factory call failed")
 
-def _request(pdf: Path, mode: PassMode = PassMode.TWO_PASS) -> ExtractRequest:
+_FIELDS_AB = (SchemaField(key="a", label="A", page=1), SchemaField(key="b", label="B", page=1))
+
+_SCHEMA_A = SchemaSpec(
+    id="id",
+    name="name",
+    fingerprint="abc",
+    fields=(SchemaField(key="a", label="A"),),
+)
+_SCHEMA_A_PAGE1 = SchemaSpec(
+    id="id",
+    name="name",
+    fingerprint="fp",
+    fields=(SchemaField(key="a", label="A", page=1),),
+)
+_AV_FIELD = FieldValue(key="a", value="v", confidence=ConfidenceLevel.HIGH)
+_FOUND_A = FieldValue(key="a", value="found", page=1, confidence=ConfidenceLevel.HIGH)
+_RESULT_A_V = ExtractionResult(
+    fields=[_AV_FIELD],
+    flat={"a": "v"},
+    schema_fields_count=1,
+    pricing=None,
+)
+
+
+def _request(
+    pdf: Path,
+    mode: PassMode = PassMode.TWO_PASS,
+    output_path: Path | None = None,
+) -> ExtractRequest:
     return ExtractRequest(
         input_path=pdf,
-        output_path=pdf.parent / "result.json",
+        output_path=output_path,
         mode=mode,
         dpi=120,
         image_format="png",
     )
 
 
-def _rendered_page(page_number: int) -> RenderedPage:
-    return RenderedPage(page_number=page_number, mime_type="image/png", data_base64="AA==")
+class _FakeStore:
+    """Schema store stub serving ``_SCHEMA_A`` without a cache match."""
 
+    matched = False
 
-def test_extract_values_fills_missing_with_null(monkeypatch, tmp_path: Path) -> None:
-    pdf = tmp_path / "doc.pdf"
-    pdf.write_bytes(b"doc")
+    def __init__(self, root: Path) -> None:
+        self.root = root
 
-    schema = SchemaSpec(
-        id="id",
-        name="name",
-        fingerprint="fp",
-        fields=[SchemaField(key="a", label="A", page=1), SchemaField(key="b", label="B", page=1)],
-    )
+    @staticmethod
+    def fingerprint_pdf(path: Path, algorithm: object = None) -> str:
+        _ = (path, algorithm)
+        return _SCHEMA_A.fingerprint
 
-    class _FakeBackend:
-        def __init__(self, settings) -> None:
-            self.settings = settings
+    def match_schema(self, fingerprint: str) -> MatchResult:
+        _ = fingerprint
+        return MatchResult(matched=self.matched, schema_id=_SCHEMA_A.id if self.matched else None)
 
-        def extract_values(self, pages, keys, extra_instructions=None):
-            return [FieldValue(key="a", value="x", page=1, confidence=ConfidenceLevel.HIGH)], None
+    def load_by_fingerprint(self, fingerprint: str) -> SchemaSpec | None:
+        _ = fingerprint
+        return _SCHEMA_A if self.matched else None
 
-    page = _rendered_page(1)
+    def list_schemas(self) -> list[Path]:
+        return [self.root / "schema.schema.json"]
 
-    monkeypatch.setattr("extractforms.extractor.render_pdf_pages", lambda *args, **kwargs: [page])
-    monkeypatch.setattr("extractforms.extractor.MultimodalLLMBackend", _FakeBackend)
+    def load(self, path: Path) -> SchemaSpec:
+        _ = path
+        return _SCHEMA_A
 
-    result, _ = extract_values(schema, _request(pdf), Settings(null_sentinel="NULL"))
+    def save(self, schema_obj: SchemaSpec) -> Path:
+        _ = schema_obj
+        return self.root / "saved.json"
 
-    assert result.flat["a"] == "x"
-    assert result.flat["b"] == "NULL"
 
+class _CachedStore(_FakeStore):
+    """Schema store stub whose fingerprint lookup hits ``_SCHEMA_A``."""
 
-def test_run_extract_two_pass_with_cached_schema(monkeypatch, tmp_path: Path) -> None:
-    pdf = tmp_path / "doc.pdf"
-    pdf.write_bytes(b"doc")
+    matched = True
 
-    schema = SchemaSpec(
-        id="id",
-        name="name",
-        fingerprint="abc",
-        fields=[SchemaField(key="a", label="A")],
-    )
 
-    class _FakeStore:
-        def __init__(self, root: Path) -> None:
-            self.root = root
+class _Scenario(NamedTuple):
+    store_cls: type[_FakeStore]
+    schema_path: Path | None
+    cache_hit: bool
+    inferred: bool
 
-        @staticmethod
-        def fingerprint_pdf(path: Path) -> str:
-            return "abc"
 
-        def match_schema(self, fingerprint: str):
-            class _Match:
-                matched = True
-                schema_id = "id"
+def _patch_extractor(monkeypatch: pytest.MonkeyPatch, **targets: object) -> None:
+    for name, value in targets.items():
+        monkeypatch.setattr(extractor, name, value)
 
-            return _Match()
 
-        def list_schemas(self):
-            return [pdf.parent / "schema.schema.json"]
+class _FakeBackend:
+    """Multimodal backend stub delegating value extraction to a per-test responder."""
 
-        def load(self, path: Path) -> SchemaSpec:
-            return schema
+    def __init__(self, settings: Settings, responder: _Responder) -> None:
+        self.settings = settings
+        self._responder = responder
 
-        def save(self, schema_obj: SchemaSpec) -> Path:
-            return pdf.parent / "saved.json"
+    def extract_values(
+        self,
+        pages: Sequence[RenderedPage],
+        keys: list[str],
+        extra_instructions: str | None = None,
+    ) -> tuple[list[FieldValue], None]:
+        return self._responder(pages, keys, extra_instructions)
 
-    monkeypatch.setattr("extractforms.extractor.SchemaStore", _FakeStore)
-    monkeypatch.setattr(
-        "extractforms.extractor.extract_values",
-        lambda schema_obj, request, settings: (
-            ExtractionResult(
-                fields=[FieldValue(key="a", value="v", confidence=ConfidenceLevel.HIGH)],
-                flat={"a": "v"},
-                schema_fields_count=1,
-                pricing=None,
-            ),
-            None,
-        ),
-    )
 
-    result = run_extract(_request(pdf, PassMode.TWO_PASS), Settings(schema_cache_dir=str(tmp_path)))
-    assert result.flat["a"] == "v"
+class _FakeOCRBackend:
+    """OCR backend stub answering ``a=ocr`` for every page batch."""
 
+    def __init__(
+        self,
+        provider: object = None,
+        null_sentinel: str = "NULL",
+        text_normalizer: object = None,
+    ) -> None:
+        _ = (provider, null_sentinel, text_normalizer)
 
-def test_persist_and_result_to_json_dict(tmp_path: Path) -> None:
-    result = ExtractionResult(
-        fields=[FieldValue(key="a", value="v", confidence=ConfidenceLevel.HIGH)],
-        flat={"a": "v"},
-        schema_fields_count=1,
-        pricing=None,
-    )
+    def extract_values(
+        self,
+        pages: Sequence[RenderedPage],
+        keys: list[str],
+        extra_instructions: str | None = None,
+    ) -> tuple[list[FieldValue], None]:
+        _ = (pages, keys, extra_instructions)
+        return [FieldValue(key="a", value="ocr", page=1, confidence=ConfidenceLevel.HIGH)], None
 
-    output = tmp_path / "result.json"
-    persist_result(result, output)
 
-    data = result_to_json_dict(result)
-    flat = cast("dict[str, str]", data["flat"])
+def _no_values(
+    pages: Sequence[RenderedPage],
+    keys: list[str],
+    extra_instructions: str | None,
+) -> tuple[list[FieldValue], None]:
+    _ = (pages, keys, extra_instructions)
+    return [], None
 
-    assert output.exists()
-    assert flat["a"] == "v"
 
+@dataclass
+class _ExtractPatches:
+    """Pages and backend responder served to ``extract_values`` by the ``patched_extract`` fixture."""
 
-def test_run_extract_one_pass(monkeypatch, tmp_path: Path) -> None:
-    pdf = tmp_path / "doc.pdf"
-    pdf.write_bytes(b"doc")
+    pages: list[RenderedPage] = field(default_factory=list)
+    responder: _Responder = _no_values
 
-    expected = ExtractionResult(
-        fields=[FieldValue(key="a", value="v", confidence=ConfidenceLevel.HIGH)],
-        flat={"a": "v"},
-        schema_fields_count=1,
-        pricing=None,
+
+@pytest.fixture
+def patched_extract(monkeypatch: pytest.MonkeyPatch) -> _ExtractPatches:
+    patches = _ExtractPatches()
+    _patch_extractor(
+        monkeypatch,
+        render_pdf_pages=lambda *args, **kwargs: patches.pages,
+        MultimodalLLMBackend=lambda settings: _FakeBackend(settings, patches.responder),
     )
+    return patches
 
-    monkeypatch.setattr("extractforms.extractor.extract_one_pass", lambda request, settings: (expected, None))
-    result = run_extract(_request(pdf, PassMode.ONE_PASS), Settings(schema_cache_dir=str(tmp_path)))
 
-    assert result.flat["a"] == "v"
+@cache
+def _rendered_page(page_number: int) -> RenderedPage:
+    return RenderedPage(page_number=page_number, mime_type="image/png", data=b"\x00")
 
 
-def test_extract_one_pass_disables_page_groups(monkeypatch, tmp_path: Path) -> None:
-    pdf = tmp_path / "doc.pdf"
-    pdf.write_bytes(b"doc")
+def test_extract_values_fills_missing_with_null(
+    patched_extract: _ExtractPatches,
+    stub_pdf: Path,
+    make_settings: Callable[..., Settings],
+) -> None:
+    pdf = stub_pdf
 
     schema = SchemaSpec(
         id="id",
         name="name",
         fingerprint="fp",
-        fields=[SchemaField(key="a", label="A", page=1)],
-    )
-    expected = ExtractionResult(
-        fields=[FieldValue(key="a", value="v", confidence=ConfidenceLevel.HIGH)],
-        flat={"a": "v"},
-        schema_fields_count=1,
-        pricing=None,
+        fields=_FIELDS_AB,
     )
 
-    monkeypatch.setattr("extractforms.extractor.infer_schema", lambda request, settings: (schema, None))
+    def _respond(pages, keys, extra_instructions):
+        _ = (pages, keys, extra_instructions)
+        return [FieldValue(key="a", value="x", page=1, confidence=ConfidenceLevel.HIGH)], None
 
-    observed: dict[str, object] = {}
+    patched_extract.pages = [_rendered_page(1)]
+    patched_extract.responder = _respond
 
-    def _fake_extract_values(schema_obj, request, settings, *, use_page_groups=True):
-        _ = (schema_obj, request, settings)
-        observed["use_page_groups"] = use_page_groups
-        return expected, None
+    result, _ = extract_values(schema, _request(pdf), make_settings(null_sentinel="NULL"))
 
-    monkeypatch.setattr("extractforms.extractor.extract_values", _fake_extract_values)
-    result, _ = extract_one_pass(_request(pdf, PassMode.ONE_PASS), Settings(schema_cache_dir=str(tmp_path)))
+    assert result.flat["a"] == "x"
+    assert result.flat["b"] == "NULL"
+
+
+@pytest.mark.parametrize(
+    "scenario",
+    [
+        pytest.param(_Scenario(_CachedStore, None, cache_hit=True, inferred=False), id="two-pass-cache-hit"),
+        pytest.param(
+            _Scenario(_FakeStore, None, cache_hit=False, inferred=True),
+            id="two-pass-infers-and-saves",
+        ),
+        pytest.param(
+            _Scenario(_FakeStore, Path("schema.schema.json"), cache_hit=False, inferred=False),
+            id="schema-path",
+        ),
+    ],
+)
+def test_run_extract_scenarios(
+    monkeypatch,
+    stub_pdf: Path,
+    tmp_path: Path,
+    scenario: _Scenario,
+    make_settings: Callable[..., Settings],
+) -> None:
+    infer_calls: list[ExtractRequest] = []
+
+    def _infer_schema(request: ExtractRequest, settings: Settings) -> tuple[SchemaSpec, None]:
+        _ = settings
+        infer_calls.append(request)
+        return _SCHEMA_A, None
+
+    _patch_extractor(
+        monkeypatch,
+        SchemaStore=scenario.store_cls,
+        infer_schema=_infer_schema,
+        extract_values=lambda schema_obj, request, settings: (_RESULT_A_V, None),
+    )
+    request = ExtractRequest(input_path=stub_pdf, mode=PassMode.TWO_PASS, schema_path=scenario.schema_path)
+
+    result = run_extract(request, make_settings(schema_cache_dir=str(tmp_path)))
 
-    assert observed["use_page_groups"] is False
     assert result.flat["a"] == "v"
+    assert result.schema_fields_count == 1
+    assert result.metadata["cache_hit"] is scenario.cache_hit
+    assert bool(infer_calls) is scenario.inferred
 
 
-def test_run_extract_one_schema_pass_errors_without_schema_id(tmp_path: Path) -> None:
-    pdf = tmp_path / "doc.pdf"
-    pdf.write_bytes(b"doc")
+def test_persist_result_writes_file(tmp_path: Path) -> None:
+    output = tmp_path / "result.json"
+    persist_result(_RESULT_A_V, output)
 
-    request = _request(pdf, PassMode.ONE_SCHEMA_PASS)
-    with pytest.raises(ExtractionError, match="requires --schema-id"):
-        run_extract(request, Settings(schema_cache_dir=str(tmp_path)))
+    assert output.exists()
 
 
-def test_run_extract_two_pass_infers_and_saves(monkeypatch, tmp_path: Path) -> None:
-    pdf = tmp_path / "doc.pdf"
-    pdf.write_bytes(b"doc")
+def test_result_to_json_dict_shape() -> None:
+    data = result_to_json_dict(_RESULT_A_V)
+    flat = cast("dict[str, str]", data["flat"])
+    fields = cast("list[dict[str, object]]", data["fields"])
 
-    schema = SchemaSpec(
-        id="id",
-        name="name",
-        fingerprint="abc",
-        fields=[SchemaField(key="a", label="A")],
-    )
+    assert flat["a"] == "v"
+    assert fields[0]["confidence"] == "high"
 
-    class _NoMatchStore:
-        def __init__(self, root: Path) -> None:
-            self.root = root
-            self.saved = False
-
-        @staticmethod
-        def fingerprint_pdf(path: Path) -> str:
-            return "abc"
-
-        def match_schema(self, fingerprint: str):
-            class _Match:
-                matched = False
-                schema_id = None
-
-            return _Match()
-
-        def list_schemas(self):
-            return []
-
-        def load(self, path: Path) -> SchemaSpec:
-            return schema
-
-        def save(self, schema_obj: SchemaSpec) -> Path:
-            self.saved = True
-            return self.root / "saved.json"
-
-    monkeypatch.setattr("extractforms.extractor.SchemaStore", _NoMatchStore)
-    monkeypatch.setattr("extractforms.extractor.infer_schema", lambda request, settings: (schema, None))
-    monkeypatch.setattr(
-        "extractforms.extractor.extract_values",
-        lambda schema_obj, request, settings: (
-            ExtractionResult(
-                fields=[FieldValue(key="a", value="v", confidence=ConfidenceLevel.HIGH)],
-                flat={"a": "v"},
-                schema_fields_count=1,
-                pricing=None,
-            ),
-            None,
-        ),
-    )
 
-    result = run_extract(_request(pdf, PassMode.TWO_PASS), Settings(schema_cache_dir=str(tmp_path)))
-    assert result.schema_fields_count == 1
+def test_run_extract_one_pass(
+    monkeypatch,
+    stub_pdf: Path,
+    tmp_path: Path,
+    make_settings: Callable[..., Settings],
+) -> None:
+    pdf = stub_pdf
 
+    expected = _RESULT_A_V
 
-def test_run_extract_with_schema_path(monkeypatch, tmp_path: Path) -> None:
-    pdf = tmp_path / "doc.pdf"
-    schema_path = tmp_path / "schema.schema.json"
-    pdf.write_bytes(b"doc")
-    schema_path.write_text("{}", encoding="utf-8")
+    _patch_extractor(monkeypatch, extract_one_pass=lambda request, settings: (expected, None))
+    result = run_extract(_request(pdf, PassMode.ONE_PASS), make_settings(schema_cache_dir=str(tmp_path)))
 
-    schema = SchemaSpec(
-        id="id",
-        name="name",
-        fingerprint="fp",
-        fields=[SchemaField(key="a", label="A")],
-    )
+    assert result.flat["a"] == "v"
 
-    request = ExtractRequest(
-        input_path=pdf,
-        output_path=tmp_path / "result.json",
-        schema_path=schema_path,
-    )
 
-    class _Store:
-        def __init__(self, root: Path) -> None:
-            self.root = root
-
-        def load(self, path: Path) -> SchemaSpec:
-            assert path == schema_path
-            return schema
-
-    monkeypatch.setattr("extractforms.extractor.SchemaStore", _Store)
-    monkeypatch.setattr(
-        "extractforms.extractor.extract_values",
-        lambda schema_obj, req, settings: (
-            ExtractionResult(
-                fields=[FieldValue(key="a", value="v", confidence=ConfidenceLevel.HIGH)],
-                flat={"a": "v"},
-                schema_fields_count=1,
-                pricing=None,
-            ),
-            None,
-        ),
+def test_extract_one_pass_disables_page_groups(
+    monkeypatch,
+    stub_pdf: Path,
+    tmp_path: Path,
+    make_settings: Callable[..., Settings],
+) -> None:
+    pdf = stub_pdf
+
+    schema = _SCHEMA_A_PAGE1
+    expected = _RESULT_A_V
+
+    _patch_extractor(monkeypatch, infer_schema=lambda request, settings: (schema, None))
+
+    observed: dict[str, object] = {}
+
+    def _fake_extract_values(schema_obj, request, settings, *, use_page_groups=True):
+        _ = (schema_obj, request, settings)
+        observed["use_page_groups"] = use_page_groups
+        return expected, None
+
+    _patch_extractor(monkeypatch, extract_values=_fake_extract_values)
+    result, _ = extract_one_pass(
+        _request(pdf, PassMode.ONE_PASS),
+        make_settings(schema_cache_dir=str(tmp_path)),
     )
 
-    result = run_extract(request, Settings(schema_cache_dir=str(tmp_path)))
+    assert observed["use_page_groups"] is False
     assert result.flat["a"] == "v"
 
 
-def test_extract_values_handles_mixed_paged_and_non_paged_keys(monkeypatch, tmp_path: Path) -> None:
-    pdf = tmp_path / "doc.pdf"
-    pdf.write_bytes(b"doc")
+def test_run_extract_one_schema_pass_errors_without_schema_id(
+    stub_pdf: Path,
+    tmp_path: Path,
+    make_settings: Callable[..., Settings],
+) -> None:
+    pdf = stub_pdf
+
+    request = _request(pdf, PassMode.ONE_SCHEMA_PASS)
+    with pytest.raises(ExtractionError, match=_REQUIRES_SCHEMA_ID):
+        run_extract(request, make_settings(schema_cache_dir=str(tmp_path)))
+
+
+def test_extract_values_handles_mixed_paged_and_non_paged_keys(
+    patched_extract: _ExtractPatches,
+    stub_pdf: Path,
+    make_settings: Callable[..., Settings],
+) -> None:
+    pdf = stub_pdf
 
     schema = SchemaSpec(
         id="id",
@@ -321,31 +366,25 @@ def test_extract_values_handles_mixed_paged_and_non_paged_keys(monkeypatch, tmp_
         ],
     )
 
-    class _FakeBackend:
-        def __init__(self, settings) -> None:
-            self.settings = settings
-
-        def extract_values(self, pages, keys, extra_instructions=None):
-            _ = (pages, extra_instructions)
-            values: list[FieldValue] = []
-            if "paged_key" in keys:
-                values.append(
-                    FieldValue(key="paged_key", value="paged", page=1, confidence=ConfidenceLevel.HIGH),
-                )
-            if "free_key" in keys:
-                values.append(
-                    FieldValue(key="free_key", value="free", page=1, confidence=ConfidenceLevel.MEDIUM),
-                )
-            return values, None
-
-    page1 = _rendered_page(1)
-    page2 = _rendered_page(2)
-    monkeypatch.setattr("extractforms.extractor.render_pdf_pages", lambda *args, **kwargs: [page1, page2])
-    monkeypatch.setattr("extractforms.extractor.MultimodalLLMBackend", _FakeBackend)
+    def _respond(pages, keys, extra_instructions):
+        _ = (pages, extra_instructions)
+        values: list[FieldValue] = []
+        if "paged_key" in keys:
+            values.append(
+                FieldValue(key="paged_key", value="paged", page=1, confidence=ConfidenceLevel.HIGH),
+            )
+        if "free_key" in keys:
+            values.append(
+                FieldValue(key="free_key", value="free", page=1, confidence=ConfidenceLevel.MEDIUM),
+            )
+        return values, None
+
+    patched_extract.pages = [_rendered_page(1), _rendered_page(2)]
+    patched_extract.responder = _respond
 
     request = _request(pdf, PassMode.TWO_PASS)
     request.chunk_pages = 2
-    result, _ = extract_values(schema, request, Settings(null_sentinel="NULL"))
+    result, _ = extract_values(schema, request, make_settings(null_sentinel="NULL"))
 
     assert result.flat["paged_key"] == "paged"
     assert result.flat["free_key"] == "free"
@@ -370,9 +409,12 @@ def test_infer_sparse_keys_by_page_uses_nearest_anchored_field() -> None:
     assert unresolved == []
 
 
-def test_extract_values_uses_chunk_pages_for_non_paged_keys(monkeypatch, tmp_path: Path) -> None:
-    pdf = tmp_path / "doc.pdf"
-    pdf.write_bytes(b"doc")
+def test_extract_values_uses_chunk_pages_for_non_paged_keys(
+    patched_extract: _ExtractPatches,
+    stub_pdf: Path,
+    make_settings: Callable[..., Settings],
+) -> None:
+    pdf = stub_pdf
 
     schema = SchemaSpec(
         id="id",
@@ -383,69 +425,33 @@ def test_extract_values_uses_chunk_pages_for_non_paged_keys(monkeypatch, tmp_pat
 
     calls: list[int] = []
 
-    class _FakeBackend:
-        def __init__(self, settings) -> None:
-            self.settings = settings
+    def _respond(pages, keys, extra_instructions):
+        _ = (keys, extra_instructions)
+        calls.append(len(pages))
+        return [
+            FieldValue(key="a", value="value-a", page=1, confidence=ConfidenceLevel.MEDIUM),
+            FieldValue(key="b", value="", page=1, confidence=ConfidenceLevel.UNKNOWN),
+        ], None
 
-        def extract_values(self, pages, keys, extra_instructions=None):
-            calls.append(len(pages))
-            return [
-                FieldValue(key="a", value="value-a", page=1, confidence=ConfidenceLevel.MEDIUM),
-                FieldValue(key="b", value="", page=1, confidence=ConfidenceLevel.UNKNOWN),
-            ], None
-
-    pages = [_rendered_page(idx) for idx in [1, 2, 3]]
-    monkeypatch.setattr("extractforms.extractor.render_pdf_pages", lambda *args, **kwargs: pages)
-    monkeypatch.setattr("extractforms.extractor.MultimodalLLMBackend", _FakeBackend)
+    patched_extract.pages = [_rendered_page(idx) for idx in [1, 2, 3]]
+    patched_extract.responder = _respond
 
     request = _request(pdf, PassMode.TWO_PASS)
     request.chunk_pages = 2
-    result, _ = extract_values(schema, request, Settings(null_sentinel="NULL"))
+    result, _ = extract_values(schema, request, make_settings(null_sentinel="NULL"))
 
     assert calls == [2, 1]
     assert result.flat["a"] == "value-a"
 
 
-def test_extract_values_retries_missing_paged_keys_on_all_pages(monkeypatch, tmp_path: Path) -> None:
-    pdf = tmp_path / "doc.pdf"
-    pdf.write_bytes(b"doc")
-
-    schema = SchemaSpec(
-        id="id",
-        name="name",
-        fingerprint="fp",
-        fields=[SchemaField(key="a", label="A", page=2)],
-    )
-
-    calls: list[tuple[int, tuple[str, ...]]] = []
-
-    class _FakeBackend:
-        def __init__(self, settings) -> None:
-            self.settings = settings
-
-        def extract_values(self, pages, keys, extra_instructions=None):
-            _ = extra_instructions
-            calls.append((len(pages), tuple(keys)))
-            if len(pages) == 1:
-                return [FieldValue(key="a", value="", page=2, confidence=ConfidenceLevel.UNKNOWN)], None
-            return [FieldValue(key="a", value="found", page=1, confidence=ConfidenceLevel.HIGH)], None
-
-    page1 = _rendered_page(1)
-    page2 = _rendered_page(2)
-    monkeypatch.setattr("extractforms.extractor.render_pdf_pages", lambda *args, **kwargs: [page1, page2])
-    monkeypatch.setattr("extractforms.extractor.MultimodalLLMBackend", _FakeBackend)
-
-    request = _request(pdf, PassMode.TWO_PASS)
-    request.chunk_pages = 2
-    result, _ = extract_values(schema, request, Settings(null_sentinel="NULL"))
-
-    assert result.flat["a"] == "found"
-    assert calls == [(1, ("a",)), (2, ("a",))]
-
-
-def test_extract_values_retries_when_paged_value_is_null_sentinel(monkeypatch, tmp_path: Path) -> None:
-    pdf = tmp_path / "doc.pdf"
-    pdf.write_bytes(b"doc")
+@pytest.mark.parametrize("first_value", ["", "NULL"], ids=["empty", "null-sentinel"])
+def test_extract_values_retries_missing_paged_keys_on_all_pages(
+    patched_extract: _ExtractPatches,
+    stub_pdf: Path,
+    first_value: str,
+    make_settings: Callable[..., Settings],
+) -> None:
+    pdf = stub_pdf
 
     schema = SchemaSpec(
         id="id",
@@ -456,33 +462,31 @@ def test_extract_values_retries_when_paged_value_is_null_sentinel(monkeypatch, t
 
     calls: list[tuple[int, tuple[str, ...]]] = []
 
-    class _FakeBackend:
-        def __init__(self, settings) -> None:
-            self.settings = settings
+    def _respond(pages, keys, extra_instructions):
+        _ = extra_instructions
+        calls.append((len(pages), tuple(keys)))
+        if len(pages) == 1:
+            return [FieldValue(key="a", value=first_value, page=2, confidence=ConfidenceLevel.UNKNOWN)], None
+        return [_FOUND_A], None
 
-        def extract_values(self, pages, keys, extra_instructions=None):
-            _ = extra_instructions
-            calls.append((len(pages), tuple(keys)))
-            if len(pages) == 1:
-                return [FieldValue(key="a", value="NULL", page=2, confidence=ConfidenceLevel.UNKNOWN)], None
-            return [FieldValue(key="a", value="found", page=1, confidence=ConfidenceLevel.HIGH)], None
-
-    page1 = _rendered_page(1)
-    page2 = _rendered_page(2)
-    monkeypatch.setattr("extractforms.extractor.render_pdf_pages", lambda *args, **kwargs: [page1, page2])
-    monkeypatch.setattr("extractforms.extractor.MultimodalLLMBackend", _FakeBackend)
+    patched_extract.pages = [_rendered_page(1), _rendered_page(2)]
+    patched_extract.responder = _respond
 
     request = _request(pdf, PassMode.TWO_PASS)
     request.chunk_pages = 2
-    result, _ = extract_values(schema, request, Settings(null_sentinel="NULL"))
+    result, _ = extract_values(schema, request, make_settings(null_sentinel="NULL"))
 
     assert result.flat["a"] == "found"
     assert calls == [(1, ("a",)), (2, ("a",))]
 
 
-def test_extract_values_maps_logical_schema_pages_to_nonblank_pdf_pages(monkeypatch, tmp_path: Path) -> None:
-    pdf = tmp_path / "doc.pdf"
-    pdf.write_bytes(b"doc")
+def test_extract_values_maps_logical_schema_pages_to_nonblank_pdf_pages(
+    monkeypatch,
+    patched_extract: _ExtractPatches,
+    stub_pdf: Path,
+    make_settings: Callable[..., Settings],
+) -> None:
+    pdf = stub_pdf
 
     schema = SchemaSpec(
         id="id",
@@ -492,42 +496,34 @@ def test_extract_values_maps_logical_schema_pages_to_nonblank_pdf_pages(monkeypa
     )
     routed_pages: list[int] = []
 
-    class _FakeBackend:
-        def __init__(self, settings) -> None:
-            self.settings = settings
-
-        def extract_values(self, pages, keys, extra_instructions=None):
-            _ = (keys, extra_instructions)
-            routed_pages.extend([page.page_number for page in pages])
-            return [FieldValue(key="a", value="found", page=3, confidence=ConfidenceLevel.HIGH)], None
-
-    page1 = _rendered_page(1)
-    page2 = _rendered_page(2)
-    page3 = _rendered_page(3)
-    monkeypatch.setattr(
-        "extractforms.extractor.render_pdf_pages",
-        lambda *args, **kwargs: [page1, page2, page3],
-    )
-    monkeypatch.setattr("extractforms.extractor.MultimodalLLMBackend", _FakeBackend)
-    monkeypatch.setattr(
-        "extractforms.extractor.analyze_page_selection",
-        lambda *args, **kwargs: type(
-            "Analysis",
-            (),
-            {"selected_page_numbers": [1, 2, 3], "nonblank_page_numbers": [1, 3]},
-        )(),
+    def _respond(pages, keys, extra_instructions):
+        _ = (keys, extra_instructions)
+        routed_pages.extend([page.page_number for page in pages])
+        return [FieldValue(key="a", value="found", page=3, confidence=ConfidenceLevel.HIGH)], None
+
+    patched_extract.pages = [_rendered_page(1), _rendered_page(2), _rendered_page(3)]
+    patched_extract.responder = _respond
+    _patch_extractor(
+        monkeypatch,
+        analyze_page_selection=lambda *args, **kwargs: PageSelectionAnalysis(
+            selected_page_numbers=(1, 2, 3),
+            nonblank_page_numbers=(1, 3),
+        ),
     )
 
     request = _request(pdf, PassMode.TWO_PASS)
-    result, _ = extract_values(schema, request, Settings(null_sentinel="NULL"))
+    result, _ = extract_values(schema, request, make_settings(null_sentinel="NULL"))
 
     assert result.flat["a"] == "found"
     assert routed_pages == [3]
 
 
-def test_extract_values_applies_typed_value_normalization(monkeypatch, tmp_path: Path) -> None:
-    pdf = tmp_path / "doc.pdf"
-    pdf.write_bytes(b"doc")
+def test_extract_values_applies_typed_value_normalization(
+    patched_extract: _ExtractPatches,
+    stub_pdf: Path,
+    make_settings: Callable[..., Settings],
+) -> None:
+    pdf = stub_pdf
 
     schema = SchemaSpec(
         id="id",
@@ -544,127 +540,60 @@ def test_extract_values_applies_typed_value_normalization(monkeypatch, tmp_path:
         ],
     )
 
-    class _FakeBackend:
-        def __init__(self, settings) -> None:
-            self.settings = settings
-
-        def extract_values(self, pages, keys, extra_instructions=None):
-            _ = (pages, keys, extra_instructions)
-            return [
-                FieldValue(
-                    key="phone",
-                    value="00 33 6 12 34 56 78",
-                    page=1,
-                    confidence=ConfidenceLevel.HIGH,
-                ),
-            ], None
-
-    page1 = _rendered_page(1)
-    monkeypatch.setattr("extractforms.extractor.render_pdf_pages", lambda *args, **kwargs: [page1])
-    monkeypatch.setattr("extractforms.extractor.MultimodalLLMBackend", _FakeBackend)
+    def _respond(pages, keys, extra_instructions):
+        _ = (pages, keys, extra_instructions)
+        return [
+            FieldValue(
+                key="phone",
+                value="00 33 6 12 34 56 78",
+                page=1,
+                confidence=ConfidenceLevel.HIGH,
+            ),
+        ], None
+
+    patched_extract.pages = [_rendered_page(1)]
+    patched_extract.responder = _respond
 
     request = _request(pdf, PassMode.TWO_PASS)
-    result, _ = extract_values(schema, request, Settings(null_sentinel="NULL"))
+    result, _ = extract_values(schema, request, make_settings(null_sentinel="NULL"))
 
     assert result.flat["phone"] == "+33612345678"
 
 
-def test_extract_values_uses_ocr_backend_from_settings(monkeypatch, tmp_path: Path) -> None:
-    pdf = tmp_path / "doc.pdf"
-    pdf.write_bytes(b"doc")
-    schema = SchemaSpec(
-        id="id",
-        name="name",
-        fingerprint="fp",
-        version=1,
-        schema_family_id="family",
-        fields=[SchemaField(key="a", label="A", page=1)],
+def test_extract_values_uses_ocr_backend_from_settings(
+    monkeypatch,
+    patched_extract: _ExtractPatches,
+    stub_pdf: Path,
+    make_settings: Callable[..., Settings],
+) -> None:
+    patched_extract.pages = [_rendered_page(1)]
+    _patch_extractor(
+        monkeypatch,
+        OCRBackend=_FakeOCRBackend,
+        _build_ocr_provider=lambda **kwargs: object(),
     )
 
-    class _FakeOCRBackend:
-        def __init__(self, provider=None, null_sentinel="NULL", text_normalizer=None) -> None:
-            _ = (provider, null_sentinel, text_normalizer)
-
-        def extract_values(self, pages, keys, extra_instructions=None):
-            _ = (pages, keys, extra_instructions)
-            return [FieldValue(key="a", value="ocr", page=1, confidence=ConfidenceLevel.HIGH)], None
-
-    page = _rendered_page(1)
-    monkeypatch.setattr("extractforms.extractor.render_pdf_pages", lambda *args, **kwargs: [page])
-    monkeypatch.setattr("extractforms.extractor.OCRBackend", _FakeOCRBackend)
-    monkeypatch.setattr("extractforms.extractor._build_ocr_provider", lambda **kwargs: object())
-
-    settings = Settings(null_sentinel="NULL")
-    settings.extraction_backend = ExtractionBackendType.OCR
-    result, _ = extract_values(schema, _request(pdf), settings)
+    settings = make_settings(null_sentinel="NULL", extraction_backend=ExtractionBackendType.OCR)
+    result, _ = extract_values(_SCHEMA_A_PAGE1, _request(stub_pdf), settings)
 
     assert result.flat["a"] == "ocr"
     assert result.metadata["backend"] == "ocr"
 
 
-def test_run_extract_two_pass_sets_cache_hit_metadata(monkeypatch, tmp_path: Path) -> None:
-    pdf = tmp_path / "doc.pdf"
-    pdf.write_bytes(b"doc")
-
-    schema = SchemaSpec(
-        id="id",
-        name="name",
-        fingerprint="abc",
-        version=1,
-        schema_family_id="id",
-        fields=[SchemaField(key="a", label="A")],
-    )
-
-    class _Store:
-        def __init__(self, root: Path) -> None:
-            self.root = root
-
-        @staticmethod
-        def fingerprint_pdf(path: Path) -> str:
-            _ = path
-            return "abc"
-
-        def match_schema(self, fingerprint: str):
-            _ = fingerprint
-            return type("Match", (), {"matched": True, "schema_id": "id"})()
-
-        def list_schemas(self):
-            return [self.root / "schema.schema.json"]
-
-        def load(self, path: Path) -> SchemaSpec:
-            _ = path
-            return schema
-
-    monkeypatch.setattr("extractforms.extractor.SchemaStore", _Store)
-    monkeypatch.setattr(
-        "extractforms.extractor.extract_values",
-        lambda *args, **kwargs: (
-            ExtractionResult(
-                fields=[FieldValue(key="a", value="v", confidence=ConfidenceLevel.HIGH)],
-                flat={"a": "v"},
-                schema_fields_count=1,
-                pricing=None,
-                metadata={},
-            ),
-            None,
-        ),
-    )
-    result = run_extract(_request(pdf, PassMode.TWO_PASS), Settings(schema_cache_dir=str(tmp_path)))
-    assert result.metadata["cache_hit"] is True
-
-
-def test_build_ocr_provider_wraps_factory_errors(monkeypatch, tmp_path: Path) -> None:
-    pdf = tmp_path / "doc.pdf"
-    pdf.write_bytes(b"doc")
+def test_build_ocr_provider_wraps_factory_errors(
+    monkeypatch,
+    stub_pdf: Path,
+    make_settings: Callable[..., Settings],
+) -> None:
+    pdf = stub_pdf
     request = _request(pdf)
-    settings = Settings()
-    settings.ocr_provider_factory = "pkg.module.factory"
+    settings = make_settings(ocr_provider_factory="pkg.module.factory")
 
     def _factory(**kwargs: object):
         _ = kwargs
         raise RuntimeError("boom")
 
-    monkeypatch.setattr("extractforms.extractor._load_dotted_object", lambda _: _factory)
+    _patch_extractor(monkeypatch, _load_dotted_object=lambda _: _factory)
 
-    with pytest.raises(ExtractionError, match="OCR provider factory call failed"):
+    with pytest.raises(ExtractionError, match=_OCR_FACTORY_FAILED):
         extractor._build_ocr_provider(request=request, settings=settings)
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from extractforms import logger as package_logger
 from extractforms.logging import configure_logging, get_logger
-from extractforms.settings import Settings
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from extractforms.settings import Settings
 
 
-def test_stdlib_logger_is_configured(capsys) -> None:
-    configure_logging(settings=Settings(log_json=False, log_level="INFO"), force=True)
+def test_stdlib_logger_is_configured(capsys, make_settings: Callable[..., Settings]) -> None:
+    configure_logging(settings=make_settings(log_json=False, log_level="INFO"), force=True)
     logger = get_logger("tests")
     logger.info("hello")
 
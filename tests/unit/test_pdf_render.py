@@ -41,44 +41,38 @@ class _FakeDoc:
         return _FakePage()
 
 
-class _FakeFitzModule:
-    @staticmethod
-    def open(path: Path) -> _FakeDoc:
-        assert path.name == "doc.pdf"
-        return _FakeDoc()
-
+class _FakeFitz:
+    def __init__(self, pages: int) -> None:
+        self._pages = pages
 
-class _FakeFitzThreePages:
-    @staticmethod
-    def open(path: Path) -> _FakeDoc:
+    def open(self, path: Path) -> _FakeDoc:
         assert path.name == "doc.pdf"
-        return _FakeDoc(pages=3)
+        return _FakeDoc(pages=self._pages)
 
 
-def test_render_pdf_pages_rejects_unknown_image_format(tmp_path: Path) -> None:
-    pdf = tmp_path / "doc.pdf"
-    pdf.write_bytes(b"pdf")
+def test_render_pdf_pages_rejects_unknown_image_format(stub_pdf: Path) -> None:
+    pdf = stub_pdf
 
     with pytest.raises(BackendError, match="Unsupported image format"):
         render_pdf_pages(pdf, dpi=120, image_format="gif")
 
 
-def test_render_pdf_pages_with_fake_fitz(monkeypatch, tmp_path: Path) -> None:
-    pdf = tmp_path / "doc.pdf"
-    pdf.write_bytes(b"pdf")
-
-    monkeypatch.setattr("extractforms.pdf_render.fitz", _FakeFitzModule)
-    pages = render_pdf_pages(pdf, dpi=120, image_format="png")
-
-    assert len(pages) == 1
-    assert pages[0].mime_type == "image/png"
-
-
-def test_render_pdf_pages_includes_page_end_upper_bound(monkeypatch, tmp_path: Path) -> None:
-    pdf = tmp_path / "doc.pdf"
-    pdf.write_bytes(b"pdf")
-
-    monkeypatch.setattr("extractforms.pdf_render.fitz", _FakeFitzThreePages)
-    pages = render_pdf_pages(pdf, dpi=120, image_format="png", page_end=3)
-
-    assert [page.page_number for page in pages] == [1, 2, 3]
+@pytest.mark.parametrize(
+    ("page_count", "page_end", "expected"),
+    [
+        pytest.param(1, None, [1], id="single-page"),
+        pytest.param(3, 3, [1, 2, 3], id="page-end-inclusive"),
+    ],
+)
+def test_render_pdf_pages_with_fake_fitz(
+    monkeypatch,
+    stub_pdf: Path,
+    page_count: int,
+    page_end: int | None,
+    expected: list[int],
+) -> None:
+    monkeypatch.setattr("extractforms.pdf_render.fitz", _FakeFitz(page_count))
+    pages = render_pdf_pages(stub_pdf, dpi=120, image_format="png", page_end=page_end)
+
+    assert [page.page_number for page in pages] == expected
+    assert all(page.mime_type == "image/png" for page in pages)
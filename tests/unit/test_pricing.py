@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import pytest
 
+from extractforms.exceptions import ModelMismatchError
 from extractforms.typing.models import PricingCall
 from extractforms.pricing import merge_pricing_calls
 
@@ -36,3 +37,26 @@ def test_merge_pricing_calls_preserves_none_when_unknown() -> None:
     assert merged.input_tokens is None
     assert merged.output_tokens is None
     assert merged.total_cost_usd is None
+
+
+def test_pricing_call_sum_matches_validated_instance() -> None:
+    left = PricingCall(provider="x", model="m", input_tokens=1, output_tokens=None, total_cost_usd=0.5)
+    right = PricingCall(provider="x", model="m", input_tokens=2, output_tokens=4, total_cost_usd=None)
+
+    total = left + right
+
+    assert total == PricingCall(provider="x", model="m", input_tokens=3, output_tokens=4, total_cost_usd=0.5)
+    assert total.model_dump() == {
+        "provider": "x",
+        "model": "m",
+        "input_tokens": 3,
+        "output_tokens": 4,
+        "total_cost_usd": 0.5,
+    }
+
+
+def test_pricing_call_sum_rejects_mixed_models() -> None:
+    calls = [PricingCall(provider="x", model="m"), PricingCall(provider="x", model="other")]
+
+    with pytest.raises(ModelMismatchError):
+        PricingCall.sum(calls)
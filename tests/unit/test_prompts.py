@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from extractforms.typing.models import SchemaField, SchemaSpec
 from extractforms.prompts import (
+    build_keys_extraction_prompt,
     build_schema_inference_prompt,
     build_values_extraction_prompt,
+    model_response_format,
+    model_response_format_payload,
     sanitize_json_schema,
     schema_response_format,
 )
@@ -20,7 +23,7 @@ def test_sanitize_json_schema_sets_required_and_forbids_additional_properties()
 
     cleaned = sanitize_json_schema(raw)
 
-    assert cleaned["required"] == ["bar", "foo"]
+    assert cleaned["required"] == ["foo", "bar"]
     assert cleaned["additionalProperties"] is False
 
 
@@ -45,3 +48,86 @@ def test_prompt_builders_include_extra_instructions() -> None:
     assert "extra" in schema_prompt
     assert "extra" in value_prompt
     assert "a" in value_prompt
+
+
+def test_sanitize_json_schema_does_not_mutate_input() -> None:
+    raw = {"type": "object", "properties": {"foo": {"$ref": "#/$defs/Foo", "default": None}}}
+
+    cleaned = sanitize_json_schema(raw)
+
+    assert "required" not in raw
+    assert "default" in raw["properties"]["foo"]
+    assert "default" not in cleaned["properties"]["foo"]
+
+
+def test_sanitize_json_schema_handles_deeply_nested_schemas() -> None:
+    depth = 1200
+    raw: dict[str, object] = {"type": "string"}
+    for _ in range(depth):
+        raw = {"properties": {"child": raw}}
+
+    cleaned = sanitize_json_schema(raw)
+
+    node = cleaned
+    for _ in range(depth):
+        assert node["required"] == ["child"]
+        assert node["additionalProperties"] is False
+        node = node["properties"]["child"]
+    assert node == {"type": "string"}
+
+
+def test_values_extraction_prompt_is_reused_for_same_keys() -> None:
+    def _schema(schema_id: str) -> SchemaSpec:
+        return SchemaSpec(
+            id=schema_id,
+            name="name",
+            fingerprint="fp",
+            fields=[SchemaField(key="a", label="A"), SchemaField(key="b", label="B")],
+        )
+
+    first = build_values_extraction_prompt(_schema("one"))
+    second = build_values_extraction_prompt(_schema("two"))
+
+    assert first is second
+    assert first.endswith("Keys: a, b.")
+
+
+def test_keys_extraction_prompt_matches_schema_prompt() -> None:
+    schema = SchemaSpec(
+        id="id",
+        name="name",
+        fingerprint="fp",
+        fields=[SchemaField(key="a", label="A"), SchemaField(key="b", label="B")],
+    )
+
+    assert build_keys_extraction_prompt(["a", "b"]) is build_values_extraction_prompt(schema)
+    assert build_keys_extraction_prompt(["a", "b"], extra_instructions="x") == build_values_extraction_prompt(
+        schema,
+        extra_instructions="x",
+    )
+
+
+def test_model_response_format_is_built_once_per_model() -> None:
+    first = model_response_format("schema_spec", SchemaSpec)
+    second = model_response_format("schema_spec", SchemaSpec)
+
+    assert first is second
+    assert first.json_schema == sanitize_json_schema(SchemaSpec.model_json_schema())
+    assert first.json_schema["additionalProperties"] is False
+
+
+def test_model_response_format_payload_is_isolated_per_call() -> None:
+    payload = model_response_format_payload("schema_spec", SchemaSpec)
+    response_format = model_response_format("schema_spec", SchemaSpec)
+    expected = {
+        "type": "json_schema",
+        "json_schema": response_format.model_dump(mode="json", by_alias=True),
+    }
+
+    assert payload == expected
+    assert "schema" in payload["json_schema"]
+
+    payload["json_schema"]["schema"]["properties"].clear()
+    payload["type"] = "json_object"
+
+    assert model_response_format_payload("schema_spec", SchemaSpec) == expected
@@ -1,26 +1,72 @@
 from __future__ import annotations
 
+import hashlib
 import json
+from pathlib import Path
+from typing import Any
 
 import pytest
 
-from extractforms.exceptions import SchemaStoreError
+from extractforms import schema_store
+from extractforms.exceptions import DependencyError, SchemaStoreError
 from extractforms.schema_store import (
     SchemaStore,
     build_schema_revision,
     build_schema_with_generated_id,
 )
+from extractforms.typing.enums import FingerprintAlgorithm
 from extractforms.typing.models import MatchResult, SchemaField, SchemaSpec
 
+_PDF_CONTENT = b"test-content"
 
-def test_fingerprint_pdf_is_stable(tmp_path) -> None:
-    pdf = tmp_path / "a.pdf"
-    pdf.write_bytes(b"test-content")
 
-    fp1 = SchemaStore.fingerprint_pdf(pdf)
-    fp2 = SchemaStore.fingerprint_pdf(pdf)
+def _read_json(path: Path) -> Any:  # noqa: ANN401
+    return json.loads(path.read_bytes())
 
-    assert fp1 == fp2
+
+@pytest.fixture(scope="session")
+def hashed_pdf(tmp_path_factory: pytest.TempPathFactory) -> tuple[Path, str]:
+    pdf = tmp_path_factory.mktemp("sha") / "a.pdf"
+    pdf.write_bytes(_PDF_CONTENT)
+    return pdf, SchemaStore.fingerprint_pdf(pdf)
+
+
+def test_fingerprint_pdf_is_stable(hashed_pdf: tuple[Path, str]) -> None:
+    pdf, fingerprint = hashed_pdf
+
+    assert SchemaStore.fingerprint_pdf(pdf) == fingerprint
+    assert fingerprint == hashlib.sha256(_PDF_CONTENT).hexdigest()
+
+
+def test_fingerprint_pdf_uses_blake3_when_requested(hashed_pdf: tuple[Path, str]) -> None:
+    blake3 = pytest.importorskip("blake3")
+    pdf, _ = hashed_pdf
+
+    assert (
+        SchemaStore.fingerprint_pdf(pdf, FingerprintAlgorithm.BLAKE3)
+        == blake3.blake3(_PDF_CONTENT).hexdigest()
+    )
+
+
+def test_fingerprint_pdf_requires_blake3_package(hashed_pdf: tuple[Path, str], monkeypatch) -> None:
+    pdf, _ = hashed_pdf
+    monkeypatch.setattr(schema_store, "blake3", None)
+
+    with pytest.raises(DependencyError, match="blake3"):
+        SchemaStore.fingerprint_pdf(pdf, FingerprintAlgorithm.BLAKE3)
+
+
+def test_fingerprint_pdf_memory_maps_large_files(tmp_path, monkeypatch) -> None:
+    pdf = tmp_path / "large.pdf"
+    pdf.write_bytes(b"%PDF" * 1024)
+    monkeypatch.setattr(schema_store, "_MMAP_DIGEST_MIN_BYTES", 1024)
+    monkeypatch.setattr(
+        schema_store.hashlib,
+        "file_digest",
+        lambda *_args, **_kwargs: pytest.fail("file_digest should not be used"),
+    )
+
+    assert SchemaStore.fingerprint_pdf(pdf) == hashlib.sha256(b"%PDF" * 1024).hexdigest()
 
 
 def test_save_load_and_match_schema(tmp_path) -> None:
@@ -50,24 +96,7 @@ def test_build_schema_with_generated_id() -> None:
     assert schema.schema_family_id == schema.id
 
 
-def test_schema_store_load_migrates_legacy_payload(tmp_path) -> None:
-    store = SchemaStore(root=tmp_path)
-    legacy = {
-        "id": "legacy-1",
-        "name": "Legacy",
-        "fingerprint": "fp",
-        "fields": [{"key": "a", "label": "A"}],
-    }
-    path = tmp_path / "legacy.schema.json"
-    path.write_text(json.dumps(legacy), encoding="utf-8")
-
-    loaded = store.load(path)
-
-    assert loaded.version == 1
-    assert loaded.schema_family_id == "legacy-1"
-
-
-def test_schema_store_save_uses_versioned_envelope(tmp_path) -> None:
+def test_schema_store_handles_legacy_and_versioned_payloads(tmp_path) -> None:
     store = SchemaStore(root=tmp_path)
     schema = SchemaSpec(
         id="schema-1",
@@ -77,13 +106,26 @@ def test_schema_store_save_uses_versioned_envelope(tmp_path) -> None:
         schema_family_id="family-1",
         fields=[SchemaField(key="x", label="X")],
     )
+    legacy = {
+        "id": "legacy-1",
+        "name": "Legacy",
+        "fingerprint": "fp",
+        "fields": [{"key": "a", "label": "A"}],
+    }
 
-    path = store.save(schema)
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    versioned_path = store.save(schema)
+    legacy_path = tmp_path / "legacy.schema.json"
+    legacy_path.write_text(json.dumps(legacy), encoding="utf-8")
 
+    payload = _read_json(versioned_path)
     assert payload["schema_file_version"] == 2
     assert payload["schema"]["version"] == 2
     assert payload["schema"]["schema_family_id"] == "family-1"
+    assert store.load(versioned_path) == schema
+
+    migrated = store.load(legacy_path)
+    assert migrated.version == 1
+    assert migrated.schema_family_id == "legacy-1"
 
 
 def test_build_schema_revision_increments_version_and_family() -> None:
@@ -116,3 +158,179 @@ def test_schema_store_load_rejects_non_object_payload(tmp_path) -> None:
 
     with pytest.raises(SchemaStoreError, match="must be a JSON object"):
         SchemaStore.load(path)
+
+
+def test_match_schema_only_loads_fingerprint_candidates(tmp_path, monkeypatch) -> None:
+    store = SchemaStore(root=tmp_path)
+    for index, fingerprint in enumerate(("fp-a", "fp-b", "fp-c")):
+        store.save(
+            SchemaSpec(
+                id=f"schema-{index}",
+                name="Demo",
+                fingerprint=fingerprint,
+                fields=[SchemaField(key="x", label="X")],
+            ),
+        )
+
+    loaded: list[str] = []
+    original_read = schema_store._read_schema_identity
+
+    def _tracking_read(path: Path, *, expected_fingerprint: str | None = None) -> tuple[str, str] | None:
+        loaded.append(path.name)
+        return original_read(path, expected_fingerprint=expected_fingerprint)
+
+    monkeypatch.setattr(schema_store, "_read_schema_identity", _tracking_read)
+    monkeypatch.setattr(
+        SchemaStore,
+        "load",
+        staticmethod(lambda path: pytest.fail(f"unexpected load: {path}")),
+    )
+
+    match = store.match_schema("fp-b")
+    miss = store.match_schema("unknown")
+
+    assert match.schema_id == "schema-1"
+    assert loaded == ["demo-schema-1-fp-b.schema.json"]
+    assert miss == MatchResult(matched=False, reason="no_match")
+
+
+def test_load_by_fingerprint_loads_only_the_matching_schema(tmp_path, monkeypatch) -> None:
+    store = SchemaStore(root=tmp_path)
+    for index, fingerprint in enumerate(("fp-a", "fp-b", "fp-c")):
+        store.save(SchemaSpec(id=f"schema-{index}", name="Demo", fingerprint=fingerprint, fields=[]))
+
+    loaded: list[str] = []
+    original_load = SchemaStore.load
+
+    def _tracking_load(path):
+        loaded.append(path.name)
+        return original_load(path)
+
+    monkeypatch.setattr(SchemaStore, "load", staticmethod(_tracking_load))
+
+    schema = store.load_by_fingerprint("fp-b")
+
+    assert schema is not None
+    assert schema.id == "schema-1"
+    assert loaded == ["demo-schema-1-fp-b.schema.json"]
+    assert store.load_by_fingerprint("unknown") is None
+
+
+def test_save_records_schema_in_fingerprint_index(tmp_path) -> None:
+    store = SchemaStore(root=tmp_path)
+    first = store.save(SchemaSpec(id="s1", name="Demo", fingerprint="fp", fields=[]))
+    second = store.save(SchemaSpec(id="s2", name="Demo", fingerprint="fp", fields=[]))
+
+    index = _read_json(store.fingerprint_index_path)
+
+    assert index == {"fp": sorted([first.name, second.name])}
+    assert store.list_schemas() == sorted([first, second])
+    assert store.match_schema("fp").schema_id == "s1"
+
+
+def test_concurrent_saves_use_separate_index_temp_files(tmp_path, monkeypatch) -> None:
+    first_store, second_store = SchemaStore(root=tmp_path), SchemaStore(root=tmp_path)
+    original_replace = Path.replace
+    interleaved: list[str] = []
+
+    def _interleaving_replace(self: Path, target: Path) -> Path:
+        if not interleaved:
+            interleaved.append(self.name)
+            second_store.save(SchemaSpec(id="s2", name="Demo", fingerprint="fp-2", fields=[]))
+        return original_replace(self, target)
+
+    monkeypatch.setattr(Path, "replace", _interleaving_replace)
+
+    first_store.save(SchemaSpec(id="s1", name="Demo", fingerprint="fp-1", fields=[]))
+
+    assert first_store.match_schema("fp-1").schema_id == "s1"
+    assert first_store.match_schema("fp-2").schema_id == "s2"
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_save_seeds_fingerprint_index_from_existing_schemas(tmp_path) -> None:
+    legacy = tmp_path / "legacy.schema.json"
+    legacy.write_text(
+        json.dumps({"id": "legacy-1", "name": "Legacy", "fingerprint": "fp-old", "fields": []}),
+        encoding="utf-8",
+    )
+    store = SchemaStore(root=tmp_path)
+
+    store.save(SchemaSpec(id="s1", name="Demo", fingerprint="fp-new", fields=[]))
+
+    assert _read_json(store.fingerprint_index_path)["fp-old"] == ["legacy.schema.json"]
+    assert store.match_schema("fp-old").schema_id == "legacy-1"
+    assert store.match_schema("fp-new").schema_id == "s1"
+
+
+def test_match_schema_seeds_fingerprint_index_for_legacy_cache(tmp_path) -> None:
+    legacy = tmp_path / "legacy.schema.json"
+    legacy.write_text(
+        json.dumps({"id": "legacy-1", "name": "Legacy", "fingerprint": "fp-old", "fields": []}),
+        encoding="utf-8",
+    )
+    store = SchemaStore(root=tmp_path)
+
+    assert store.match_schema("fp-old").schema_id == "legacy-1"
+    assert _read_json(store.fingerprint_index_path) == {"fp-old": ["legacy.schema.json"]}
+
+
+def test_match_schema_rebuilds_missing_index(tmp_path) -> None:
+    store = SchemaStore(root=tmp_path)
+    store.save(SchemaSpec(id="s1", name="Demo", fingerprint="fp", fields=[]))
+    store.fingerprint_index_path.unlink()
+
+    assert store.match_schema("fp").schema_id == "s1"
+    assert store.fingerprint_index_path.is_file()
+
+
+def test_match_schema_finds_schema_files_missing_from_index(tmp_path) -> None:
+    store = SchemaStore(root=tmp_path)
+    store.save(SchemaSpec(id="s1", name="Demo", fingerprint="fp", fields=[]))
+    copied = tmp_path / "manual-copy-fp-copied.schema.json"
+    copied.write_text(
+        json.dumps({"id": "copied-1", "name": "Copied", "fingerprint": "fp-copied", "fields": []}),
+        encoding="utf-8",
+    )
+
+    assert "fp-copied" not in _read_json(store.fingerprint_index_path)
+    assert store.match_schema("fp-copied").schema_id == "copied-1"
+    assert store.match_schema("fp").schema_id == "s1"
+
+
+def test_fingerprint_index_rebuild_loads_many_schemas_and_skips_broken_files(tmp_path) -> None:
+    for index in range(6):
+        payload = {"id": f"legacy-{index}", "name": "Legacy", "fingerprint": f"fp-{index % 2}", "fields": []}
+        (tmp_path / f"legacy-{index}.schema.json").write_text(json.dumps(payload), encoding="utf-8")
+    (tmp_path / "broken.schema.json").write_text("{", encoding="utf-8")
+    store = SchemaStore(root=tmp_path)
+
+    store.save(SchemaSpec(id="s1", name="Demo", fingerprint="fp-new", fields=[]))
+    index = _read_json(store.fingerprint_index_path)
+
+    assert index["fp-0"] == ["legacy-0.schema.json", "legacy-2.schema.json", "legacy-4.schema.json"]
+    assert index["fp-1"] == ["legacy-1.schema.json", "legacy-3.schema.json", "legacy-5.schema.json"]
+    assert store.match_schema("fp-1").schema_id == "legacy-1"
+
+
+def test_match_schema_rejects_payload_without_identity(tmp_path) -> None:
+    store = SchemaStore(root=tmp_path)
+    payload = {"name": "Demo", "fingerprint": "fp"}
+    (tmp_path / "demo-x-fp.schema.json").write_text(json.dumps(payload), encoding="utf-8")
+
+    with pytest.raises(SchemaStoreError, match="string id and fingerprint"):
+        store.match_schema("fp")
+
+
+def test_match_schema_skips_candidates_without_fingerprint_bytes(tmp_path, monkeypatch) -> None:
+    store = SchemaStore(root=tmp_path)
+    path = store.save(SchemaSpec(id="s1", name="Demo", fingerprint="abc123", fields=[]))
+    path.rename(tmp_path / "demo-s1-def456.schema.json")
+    store._read_fingerprint_index()  # keep the index in memory so only schema candidates would parse
+    monkeypatch.setattr(
+        schema_store.json,
+        "loads",
+        lambda data: pytest.fail(f"unexpected parse: {data!r}"),
+    )
+
+    assert store.match_schema("def456") == MatchResult(matched=False, reason="no_match")
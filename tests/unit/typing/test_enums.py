@@ -2,7 +2,12 @@ from __future__ import annotations
 
 import pytest
 
-from extractforms.typing.enums import ConfidenceLevel, ExtractionBackendType, FieldSemanticType
+from extractforms.typing.enums import (
+    ConfidenceLevel,
+    ExtractionBackendType,
+    FieldSemanticType,
+    FingerprintAlgorithm,
+)
 
 
 def test_confidence_level_from_str() -> None:
@@ -20,3 +25,7 @@ def test_field_semantic_type_from_str() -> None:
 
 def test_extraction_backend_type_from_str() -> None:
     assert ExtractionBackendType.from_str("ocr") == ExtractionBackendType.OCR
+
+
+def test_fingerprint_algorithm_from_str() -> None:
+    assert FingerprintAlgorithm.from_str("blake3") == FingerprintAlgorithm.BLAKE3
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+import dataclasses
+import sys
 from typing import TYPE_CHECKING
 
 import pytest
 from pydantic import ValidationError
 
-from extractforms.typing.models import ExtractRequest
+from extractforms.typing.enums import ConfidenceLevel
+from extractforms.typing.models import (
+    ExtractRequest,
+    FieldValue,
+    PricingCall,
+    RenderedPage,
+    SchemaField,
+    SchemaSpec,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -18,10 +28,65 @@ def test_extract_request_rejects_missing_input_path(tmp_path: Path) -> None:
         ExtractRequest(input_path=missing_pdf)
 
 
-def test_extract_request_accepts_existing_input_file(tmp_path: Path) -> None:
-    pdf = tmp_path / "doc.pdf"
-    pdf.write_bytes(b"doc")
+def test_extract_request_accepts_existing_input_file(stub_pdf: Path) -> None:
+    pdf = stub_pdf
 
     request = ExtractRequest(input_path=pdf)
 
     assert request.input_path == pdf
+
+
+def test_rendered_page_is_immutable_slotted_record() -> None:
+    page = RenderedPage(page_number=1, mime_type="image/png", data=b"\x00")
+
+    assert not hasattr(page, "__dict__")
+    assert page.data_base64 == "AA=="
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        page.page_number = 2  # ty: ignore[invalid-assignment]
+
+
+def test_schema_spec_is_frozen_and_hashable() -> None:
+    def build() -> SchemaSpec:
+        field = SchemaField(key="name", label="Name", options=("a", "b"))
+        return SchemaSpec(id="s1", name="form", fingerprint="fp", fields=[field])
+
+    spec = build()
+
+    assert hash(spec) == hash(build())
+    assert hash(spec.fields[0]) == hash(build().fields[0])
+    assert {spec: 1}[build()] == 1
+    assert isinstance(spec.fields, tuple)
+    with pytest.raises(ValidationError):
+        spec.name = "other"  # ty: ignore[invalid-assignment]
+
+
+def test_model_output_models_coerce_lax_inputs() -> None:
+    assert FieldValue.model_validate({"key": "name", "value": "Ada", "page": 1.0}).page == 1
+    assert FieldValue.model_validate({"key": "name", "value": "Ada", "page": "1"}).page == 1
+    assert FieldValue(key="name", value="Ada", confidence="high").confidence == ConfidenceLevel.HIGH  # type: ignore[arg-type]
+    assert (
+        PricingCall.model_validate({"provider": "openai", "model": "m", "input_tokens": "3"}).input_tokens
+        == 3
+    )
+
+
+def test_extract_request_rejects_directory_input_path(tmp_path: Path) -> None:
+    with pytest.raises(ValidationError, match="is not a file"):
+        ExtractRequest(input_path=tmp_path)
+
+
+def test_schema_field_keys_are_interned() -> None:
+    key = b"first_name".decode()
+
+    field = SchemaField(key=key, label="First name")
+
+    assert field.key is sys.intern("first_name")
+
+
+def test_schema_field_options_share_one_tuple_per_option_set() -> None:
+    first = SchemaField.model_validate({"key": "a", "label": "A", "options": ["yes", "no"]})
+    second = SchemaField.model_validate({"key": "b", "label": "B", "options": ["yes", "no"]})
+
+    assert first.options == ("yes", "no")
+    assert first.options is second.options
+    assert first.model_dump(mode="json")["options"] == ["yes", "no"]